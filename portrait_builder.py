@@ -6,16 +6,322 @@ and build a clean portrait layout (620×920).
 Phase 1: Title, metadata, zodiacal info, moon phase, wheel only.
 """
 
+import functools
 import re
 import sys
+from dataclasses import dataclass
+from datetime import date, time
+
+
+# Compiled once at import so each build skips the re._compile cache lookup.
+
+# apply_color_theme
+# Dark mode color palette
+_DARK_COLOR_MAP = {
+    # Paper colors (background and text)
+    '--kerykeion-chart-color-paper-0: #000000': '--kerykeion-chart-color-paper-0: #e8e8e8',  # Text: black → light gray
+    '--kerykeion-chart-color-paper-1: #ffffff': '--kerykeion-chart-color-paper-1: #0d0d0d',  # Background: white → very dark gray
+
+    # Fire signs - brighter, more saturated for dark mode
+    '--kerykeion-chart-color-zodiac-bg-0: #ff4500': '--kerykeion-chart-color-zodiac-bg-0: #ff6633',  # Aries - brighter red-orange
+    '--kerykeion-chart-color-zodiac-bg-4: #ff6b35': '--kerykeion-chart-color-zodiac-bg-4: #ff7d4d',  # Leo - brighter coral
+    '--kerykeion-chart-color-zodiac-bg-8: #ff8c42': '--kerykeion-chart-color-zodiac-bg-8: #ffa060',  # Sag - brighter orange
+
+    # Earth signs - lighter, more visible on dark
+    '--kerykeion-chart-color-zodiac-bg-1: #6b8e23': '--kerykeion-chart-color-zodiac-bg-1: #8bad3a',  # Taurus - lighter olive
+    '--kerykeion-chart-color-zodiac-bg-5: #8b7355': '--kerykeion-chart-color-zodiac-bg-5: #a68968',  # Virgo - lighter brown
+    '--kerykeion-chart-color-zodiac-bg-9: #556b2f': '--kerykeion-chart-color-zodiac-bg-9: #6d8a3d',  # Cap - lighter olive
+
+    # Air signs - brighter blues/purples
+    '--kerykeion-chart-color-zodiac-bg-2: #4682b4': '--kerykeion-chart-color-zodiac-bg-2: #5c9fd4',  # Gemini - brighter steel blue
+    '--kerykeion-chart-color-zodiac-bg-6: #6a5acd': '--kerykeion-chart-color-zodiac-bg-6: #8674e0',  # Libra - brighter slate blue
+    '--kerykeion-chart-color-zodiac-bg-10: #5f9ea0': '--kerykeion-chart-color-zodiac-bg-10: #7ab8bb', # Aquarius - brighter cadet blue
+
+    # Water signs - lighter, more luminous
+    '--kerykeion-chart-color-zodiac-bg-3: #20b2aa': '--kerykeion-chart-color-zodiac-bg-3: #3dd4cc',  # Cancer - brighter sea green
+    '--kerykeion-chart-color-zodiac-bg-7: #483d8b': '--kerykeion-chart-color-zodiac-bg-7: #6052ad',  # Scorpio - brighter slate blue
+    '--kerykeion-chart-color-zodiac-bg-11: #4169e1': '--kerykeion-chart-color-zodiac-bg-11: #5b85ff', # Pisces - brighter royal blue
+
+    # Zodiac symbol/icon colors - optimized for dark background readability
+    # Fire signs (Aries, Leo, Sagittarius) - icons 0, 4, 8
+    '--kerykeion-chart-color-zodiac-icon-0: #ff7200': '--kerykeion-chart-color-zodiac-icon-0: #ff9933',   # Fire - bright orange
+    '--kerykeion-chart-color-zodiac-icon-4: #ff7200': '--kerykeion-chart-color-zodiac-icon-4: #ff9933',   # Fire - bright orange
+    '--kerykeion-chart-color-zodiac-icon-8: #ff7200': '--kerykeion-chart-color-zodiac-icon-8: #ff9933',   # Fire - bright orange
+
+    # Earth signs (Taurus, Virgo, Capricorn) - icons 1, 5, 9
+    '--kerykeion-chart-color-zodiac-icon-1: #6b3d00': '--kerykeion-chart-color-zodiac-icon-1: #e6d4aa',   # Earth - bright tan/beige
+    '--kerykeion-chart-color-zodiac-icon-5: #6b3d00': '--kerykeion-chart-color-zodiac-icon-5: #e6d4aa',   # Earth - bright tan/beige
+    '--kerykeion-chart-color-zodiac-icon-9: #6b3d00': '--kerykeion-chart-color-zodiac-icon-9: #e6d4aa',   # Earth - bright tan/beige
+
+    # Air signs (Gemini, Libra, Aquarius) - icons 2, 6, 10
+    '--kerykeion-chart-color-zodiac-icon-2: #69acf1': '--kerykeion-chart-color-zodiac-icon-2: #99ccff',   # Air - bright sky blue
+    '--kerykeion-chart-color-zodiac-icon-6: #69acf1': '--kerykeion-chart-color-zodiac-icon-6: #99ccff',   # Air - bright sky blue
+    '--kerykeion-chart-color-zodiac-icon-10: #69acf1': '--kerykeion-chart-color-zodiac-icon-10: #99ccff', # Air - bright sky blue
+
+    # Water signs (Cancer, Scorpio, Pisces) - icons 3, 7, 11
+    '--kerykeion-chart-color-zodiac-icon-3: #2b4972': '--kerykeion-chart-color-zodiac-icon-3: #8cb3ff',   # Water - bright blue
+    '--kerykeion-chart-color-zodiac-icon-7: #2b4972': '--kerykeion-chart-color-zodiac-icon-7: #8cb3ff',   # Water - bright blue
+    '--kerykeion-chart-color-zodiac-icon-11: #2b4972': '--kerykeion-chart-color-zodiac-icon-11: #8cb3ff', # Water - bright blue
+
+    # Aspect colors - adjusted for dark background visibility
+    '--kerykeion-chart-color-conjunction: #5555ff': '--kerykeion-chart-color-conjunction: #7d7dff',    # Brighter blue
+    '--kerykeion-chart-color-sextile: #ffa500': '--kerykeion-chart-color-sextile: #ffb933',           # Brighter orange
+    '--kerykeion-chart-color-square: #ff0000': '--kerykeion-chart-color-square: #ff4444',              # Softer red
+    '--kerykeion-chart-color-trine: #00ff00': '--kerykeion-chart-color-trine: #33ff33',                # Slightly softer green
+    '--kerykeion-chart-color-opposition: #9932cc': '--kerykeion-chart-color-opposition: #b454e6',      # Brighter orchid
+
+    # Planet and celestial body colors - optimized for dark background readability
+    # Strategy: Convert all dark base colors to bright pastels while preserving color families
+
+    # Major Planets
+    '--kerykeion-chart-color-sun: #984b00': '--kerykeion-chart-color-sun: #ffd966',                   # Dark orange → bright golden yellow
+    '--kerykeion-chart-color-moon: #150052': '--kerykeion-chart-color-moon: #e8e8ff',                 # Dark purple-blue → very light lavender-white
+    '--kerykeion-chart-color-mercury: #520800': '--kerykeion-chart-color-mercury: #ffcc99',           # Dark red-brown → bright peach
+    '--kerykeion-chart-color-venus: #400052': '--kerykeion-chart-color-venus: #ffccff',               # Dark purple → bright pink-lavender
+    '--kerykeion-chart-color-mars: #540000': '--kerykeion-chart-color-mars: #ff9999',                 # Dark red → bright coral-red
+    '--kerykeion-chart-color-jupiter: #47133d': '--kerykeion-chart-color-jupiter: #cc99ff',           # Dark purple → bright purple
+    '--kerykeion-chart-color-saturn: #124500': '--kerykeion-chart-color-saturn: #ccddaa',             # Dark green → bright sage green
+    '--kerykeion-chart-color-uranus: #6f0766': '--kerykeion-chart-color-uranus: #ff99ff',             # Dark magenta → bright magenta-pink
+    '--kerykeion-chart-color-neptune: #06537f': '--kerykeion-chart-color-neptune: #99ccff',           # Dark blue → bright sky blue
+    '--kerykeion-chart-color-pluto: #713f04': '--kerykeion-chart-color-pluto: #ffcc99',               # Dark brown → bright tan-orange
+
+    # Lunar Nodes
+    '--kerykeion-chart-color-mean-node: #4c1541': '--kerykeion-chart-color-mean-node: #ffaa66',       # Dark purple → bright orange
+    '--kerykeion-chart-color-true-node: #4c1541': '--kerykeion-chart-color-true-node: #ffaa66',       # Dark purple → bright orange
+
+    # Chiron & Lilith
+    '--kerykeion-chart-color-chiron: #666f06': '--kerykeion-chart-color-chiron: #ffff99',             # Dark olive → bright yellow-green
+    '--kerykeion-chart-color-mean-lilith: #000000': '--kerykeion-chart-color-mean-lilith: #ff66cc',   # Black → bright magenta-pink
+    '--kerykeion-chart-color-true-lilith: #333333': '--kerykeion-chart-color-true-lilith: #ff66cc',   # Dark gray → bright magenta-pink
+
+    # House Cusps (Angles)
+    '--kerykeion-chart-color-first-house: #ff7e00': '--kerykeion-chart-color-first-house: #ffaa44',   # Orange → bright orange (Ascendant)
+    '--kerykeion-chart-color-fourth-house: #000000': '--kerykeion-chart-color-fourth-house: #cccccc', # Black → light gray (IC)
+    '--kerykeion-chart-color-seventh-house: #0000ff': '--kerykeion-chart-color-seventh-house: #6699ff', # Blue → bright blue (Descendant)
+    '--kerykeion-chart-color-tenth-house: #ff0000': '--kerykeion-chart-color-tenth-house: #ff6666',   # Red → bright red (MC)
+
+    # Lunar Phase - make dark portion visible on dark background
+    '--kerykeion-chart-color-lunar-phase-0: #000000': '--kerykeion-chart-color-lunar-phase-0: #888888', # Dark part: black → medium gray (clearly visible)
+    '--kerykeion-chart-color-lunar-phase-1: #ffffff': '--kerykeion-chart-color-lunar-phase-1: #f5f5f5', # Light part: white → very bright
+
+    # Element percentages - bright, readable colors for dark mode
+    '--kerykeion-chart-color-fire-percentage: #ff6600': '--kerykeion-chart-color-fire-percentage: #ffaa66',     # Fire: orange → bright orange
+    '--kerykeion-chart-color-earth-percentage: #6a2d04': '--kerykeion-chart-color-earth-percentage: #e6c49a',   # Earth: dark brown → bright tan
+    '--kerykeion-chart-color-air-percentage: #6f76d1': '--kerykeion-chart-color-air-percentage: #a0a8ff',       # Air: purple-blue → bright periwinkle
+    '--kerykeion-chart-color-water-percentage: #630e73': '--kerykeion-chart-color-water-percentage: #dd99ff',   # Water: dark purple → bright lavender
+}
+_DARK_COLOR_RE = re.compile("|".join(re.escape(old_color) for old_color in _DARK_COLOR_MAP))
+
+# enhance_typography
+_SECTION_LABEL_RE = re.compile(r"(<text[^>]*>)(Elements:|Qualities:)")
+_PLANET_LABEL_RE = re.compile(
+    r"(<text[^>]*>)(Sun:|Moon:|Mercury:|Venus:|Mars:|Jupiter:|Saturn:|Uranus:|Neptune:|Pluto:|N\. Node:|S\. Node:)"
+)
+_CUSP_LABEL_RE = re.compile(r"(<text[^>]*>)(Cusp (?:[1-9]|1[0-2]):)")
+
+# adjust_grid_spacing
+_TRANSLATE_Y_RE = re.compile(r"translate\(0,(\d+)\)")
+_CUSP_ROW_TRANSLATE_RE = re.compile(r"(<g transform='translate\(0,)(\d+)(\)'><text[^>]*><tspan[^>]*>Cusp)")
+_Y_ATTR_RE = re.compile(r"\sy='(\d+)'")
+
+# scale_grid_symbols
+# Symbol scale rewrites: planets 0.4 → 0.77, signs 0.3 → 0.50, retrograde .5 → 0.85
+_GRID_SYMBOL_SCALE_RE = re.compile(
+    r"<use transform='scale\(0\.4\)' xlink:href='#(Sun|Moon|Mercury|Venus|Mars|Jupiter|Saturn|Uranus|Neptune|Pluto|True_North_Lunar_Node|Chiron|Ascendant|Medium_Coeli|Descendant|Imum_Coeli|Mean_Lilith|True_South_Lunar_Node)' />"
+    r"|<use transform='scale\(0\.3\)' xlink:href='#(Ari|Tau|Gem|Can|Leo|Vir|Lib|Sco|Sag|Cap|Aqu|Pis)' />"
+    r"|<use transform='scale\(\.5\)' xlink:href='#retrograde'"
+)
+# Position rewrites for the rescaled symbols. The translate alternatives only
+# look ahead at the scale so the degree-text alternative can still match it.
+_GRID_SYMBOL_POS_RE = re.compile(
+    r"<g transform='translate\(5,-8\)'>(?=<use transform='scale\(0\.77\)')"
+    r"|<g transform='translate\(75,-8\)'>(?=<use transform='scale\(0\.50\)')"
+    r"|<g transform='translate\(89,-6\)'>(?=<use transform='scale\(0\.85\)')"
+    r"|(scale\(0\.77\)' xlink:href='#[^']+' /></g><text text-anchor='start' )x='19'"
+)
+_GRID_SYMBOL_TRANSLATES = {
+    "<g transform='translate(5,-8)'>": "<g transform='translate(10,-15)'>",
+    "<g transform='translate(75,-8)'>": "<g transform='translate(126,-15)'>",
+    "<g transform='translate(89,-6)'>": "<g transform='translate(141,-13)'>",
+}
+_CUSP_SYMBOL_POS_RE = re.compile(r"(Cusp \d+:</tspan></text>)<g transform='translate\([^)]+\)'>")
+_CUSP_DEGREE_TEXT_RE = re.compile(r"(Cusp \d+:.*?)<text x='\d+'[^>]*>\s*\d+°\d+'\d+'</text>")
+_CUSP_X_NUM_RE = re.compile(r"x='\d+'")
+_CUSP_DEG_SPACE_RE = re.compile(r"(>)\s+(\d+°)")
+
+# enhance_aesthetics
+# Effect filters, built once per theme. Dark mode uses a subtle glow, light
+# mode (for print) a traditional drop shadow.
+_WHEEL_FILTER_DEFS = {
+    'dark': """
+    <!-- Enhanced wheel styling (dark mode) -->
+    <defs>
+        <filter id="wheel-effect" x="-50%" y="-50%" width="200%" height="200%">
+            <feGaussianBlur stdDeviation="2" result="coloredBlur"/>
+            <feComponentTransfer>
+                <feFuncA type="linear" slope="0.4"/>
+            </feComponentTransfer>
+            <feMerge>
+                <feMergeNode in="coloredBlur"/>
+                <feMergeNode in="SourceGraphic"/>
+            </feMerge>
+        </filter>""",
+    'light': """
+    <!-- Enhanced wheel styling (light mode) -->
+    <defs>
+        <filter id="wheel-effect" x="-50%" y="-50%" width="200%" height="200%">
+            <feGaussianBlur in="SourceAlpha" stdDeviation="3"/>
+            <feOffset dx="0" dy="2" result="offsetblur"/>
+            <feComponentTransfer>
+                <feFuncA type="linear" slope="0.3"/>
+            </feComponentTransfer>
+            <feMerge>
+                <feMergeNode/>
+                <feMergeNode in="SourceGraphic"/>
+            </feMerge>
+        </filter>""",
+}
+_ASPECT_FILTER_DEFS = {
+    'dark': """
+    <!-- Enhanced aspect grid styling (dark mode) -->
+    <filter id="aspect-grid-effect" x="-10%" y="-10%" width="120%" height="120%">
+        <feGaussianBlur stdDeviation="1.5" result="coloredBlur"/>
+        <feComponentTransfer>
+            <feFuncA type="linear" slope="0.3"/>
+        </feComponentTransfer>
+        <feMerge>
+            <feMergeNode in="coloredBlur"/>
+            <feMergeNode in="SourceGraphic"/>
+        </feMerge>
+    </filter>""",
+    'light': """
+    <!-- Enhanced aspect grid styling (light mode) -->
+    <filter id="aspect-grid-effect" x="-10%" y="-10%" width="120%" height="120%">
+        <feGaussianBlur in="SourceAlpha" stdDeviation="2"/>
+        <feOffset dx="0" dy="1" result="offsetblur"/>
+        <feComponentTransfer>
+            <feFuncA type="linear" slope="0.2"/>
+        </feComponentTransfer>
+        <feMerge>
+            <feMergeNode/>
+            <feMergeNode in="SourceGraphic"/>
+        </feMerge>
+    </filter>""",
+}
+# Both filters share one defs block
+_AESTHETIC_DEFS = {
+    theme: _WHEEL_FILTER_DEFS[theme] + "\n    " + _ASPECT_FILTER_DEFS[theme] + "\n    </defs>"
+    for theme in ('light', 'dark')
+}
+_DEFS_CLOSE_RE = re.compile(r"(</defs>)")
+_EFFECT_GROUP_OPEN_RE = re.compile(r"<g kr:node='(Full_Wheel|Aspect_List|Aspect_Grid)'[^>]*>")
+_EFFECT_WRAPPERS = {
+    'Full_Wheel': "\n        <g style='filter: url(#wheel-effect)'>",
+    'Aspect_List': "\n        <g style='filter: url(#aspect-grid-effect)'>",
+    'Aspect_Grid': "\n        <g style='filter: url(#aspect-grid-effect)'>",
+}
+_EFFECT_GROUP_CLOSE_RE = re.compile(r"</g>\s*<!-- (Minimal header|11\. Aspect Grid)|</svg>")
+_CONJUNCTION_COLOR_RE = re.compile(r"(--kerykeion-chart-color-conjunction: #[0-9a-fA-F]{6})")
+
+# create_minimal_header
+_HEADER_LOCATION_RE = re.compile(r"Location:\s*([^<]+)")
+_HEADER_DATETIME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})")
+
+# build_portrait_chart
+_FONT_FAMILY_DECL = "\n        text { font-family: 'SF Pro', 'SF Pro Display', '-apple-system', 'Helvetica Neue', sans-serif; }\n        "
+_STYLE_SECTION_RE = re.compile(r'(<style[^>]*>.*?</style>)', re.DOTALL)
+_DEFS_SECTION_RE = re.compile(r'(<defs[^>]*>.*?</defs>)', re.DOTALL)
+_CHART_TITLE_RE = re.compile(r"kr:node='Chart_Title'[^>]*>([^<]+)<")
+_CHART_TITLE_TEXT_RE = re.compile(r"<text[^>]*kr:node='Chart_Title'[^>]*>.*?</text>", re.DOTALL)
+_LUNATION_TEXT_RE = re.compile(r"<text kr:node='Bottom_Left_Text_2'[^>]*>(Lunation Day:[^<]+)</text>")
+_LUNAR_PHASE_TEXT_RE = re.compile(r"<text kr:node='Bottom_Left_Text_3'[^>]*>(Lunar phase:[^<]+)</text>")
+_LUNAR_TEXTS_RE = re.compile(r"<text kr:node='Bottom_Left_Text_[23]'[^>]*>.*?</text>")
+# Landscape → portrait coordinate remaps, each applied in one alternation pass
+# Zodiacal info: y (452, 466, 508) → (0, 15, 30), x 20 → 0
+_ZODIAC_COORDS = {"y='452'": "y='0'", "y='466'": "y='15'", "y='508'": "y='30'", " x='20'": " x='0'"}
+_ZODIAC_COORD_RE = re.compile("|".join(re.escape(coord) for coord in _ZODIAC_COORDS))
+# Location, Latitude, Longitude, Date/Time, Day of Week: y (58…106) → (0…60), x 20 → 0
+_LOCATION_COORDS = {
+    "y='58'": "y='0'", "y='70'": "y='15'", "y='82'": "y='30'", "y='94'": "y='45'", "y='106'": "y='60'",
+    " x='20'": " x='0'",
+}
+_LOCATION_COORD_RE = re.compile("|".join(re.escape(coord) for coord in _LOCATION_COORDS))
+_TOP_LEFT_TEXT_OPEN_RE = re.compile(r"(<text[^>]*kr:node='Top_Left_Text_[0-9]+'[^>]*)>")
+_TRANSLATE_WRAPPER_RE = re.compile(r"<g transform='translate\([^)]+\)'>(.*)</g>", re.DOTALL)
+_CUSP_NBSP_RE = re.compile(r"Cusp\s*(?:&#160;)*(\d+):")
+_CUSP_LABEL_X_RE = re.compile(r"(<text text-anchor='start' )x='40'")
+_SCALED_USE_RE = re.compile(
+    r"<use transform='scale\(([\d.]+)\)'\s+x='([\d.]+)'\s+y='([\d.]+)'\s+xlink:href='([^']+)'\s*/>"
+)
+_COORD_RE = re.compile(r"(x|y)='([\d.]+)'")
 
 
 def extract_section(svg_content, pattern, flags=re.DOTALL):
-    """Extract a section using regex pattern."""
-    match = re.search(pattern, svg_content, flags)
+    """Extract a section using a regex pattern (string or precompiled)."""
+    if isinstance(pattern, str):
+        match = re.search(pattern, svg_content, flags)
+    else:
+        match = pattern.search(svg_content)
     return match.group(1) if match else ''
 
 
+def _find_group_span(svg_content, open_marker, end_comment):
+    """Locate a group by its opening tag and the comment that follows it.
+
+    Returns (tag_start, inner_start, inner_end), where inner_end is the offset
+    of the group's closing </g>, or None if the section isn't present. Plain
+    find() calls replace the lazy DOTALL regex this used to be, so the scan
+    stays linear however far the sentinel comment is from the tag.
+    """
+    tag_start = svg_content.find(open_marker)
+    if tag_start < 0:
+        return None
+    inner_start = svg_content.find('>', tag_start) + 1
+    if not inner_start:
+        return None
+
+    # The closing </g> may be followed by whitespace before the comment
+    comment = svg_content.find(end_comment, inner_start)
+    while comment >= 0:
+        inner_end = comment
+        while inner_end > inner_start and svg_content[inner_end - 1].isspace():
+            inner_end -= 1
+        inner_end -= 4
+        if inner_end >= inner_start and svg_content.startswith('</g>', inner_end):
+            return tag_start, inner_start, inner_end
+        comment = svg_content.find(end_comment, comment + 1)
+    return None
+
+
+def extract_group_content(svg, node_name):
+    """Extract content between opening and closing g tags, handling nested groups."""
+    # Find the opening tag; node names are fixed literals, so no regex needed
+    tag_start = svg.find(f"<g kr:node='{node_name}'")
+    if tag_start == -1:
+        return ''
+    start = svg.find('>', tag_start) + 1
+    if not start:
+        return ''
+
+    depth = 1
+
+    # Track nested <g> and </g> tags. Each find() resumes after the token it
+    # last consumed, so every byte is scanned at most once per token kind.
+    next_open = svg.find('<g ', start)
+    next_close = svg.find('</g>', start)
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            next_open = svg.find('<g ', next_open + 1)
+        else:
+            depth -= 1
+            if depth == 0:
+                return svg[start:next_close]
+            next_close = svg.find('</g>', next_close + 4)
+
+    return ''
+
+
 def apply_color_theme(svg_content, theme='light'):
     """Apply light or dark color theme to the chart.
 
@@ -26,111 +332,8 @@ def apply_color_theme(svg_content, theme='light'):
     Dark theme: Dark background, light text, adjusted colors for dark viewing
     """
     if theme == 'dark':
-        # Dark mode color palette
-        color_map = {
-            # Paper colors (background and text)
-            '--kerykeion-chart-color-paper-0: #000000': '--kerykeion-chart-color-paper-0: #e8e8e8',  # Text: black → light gray
-            '--kerykeion-chart-color-paper-1: #ffffff': '--kerykeion-chart-color-paper-1: #0d0d0d',  # Background: white → very dark gray
-
-            # Fire signs - brighter, more saturated for dark mode
-            '--kerykeion-chart-color-zodiac-bg-0: #ff4500': '--kerykeion-chart-color-zodiac-bg-0: #ff6633',  # Aries - brighter red-orange
-            '--kerykeion-chart-color-zodiac-bg-4: #ff6b35': '--kerykeion-chart-color-zodiac-bg-4: #ff7d4d',  # Leo - brighter coral
-            '--kerykeion-chart-color-zodiac-bg-8: #ff8c42': '--kerykeion-chart-color-zodiac-bg-8: #ffa060',  # Sag - brighter orange
-
-            # Earth signs - lighter, more visible on dark
-            '--kerykeion-chart-color-zodiac-bg-1: #6b8e23': '--kerykeion-chart-color-zodiac-bg-1: #8bad3a',  # Taurus - lighter olive
-            '--kerykeion-chart-color-zodiac-bg-5: #8b7355': '--kerykeion-chart-color-zodiac-bg-5: #a68968',  # Virgo - lighter brown
-            '--kerykeion-chart-color-zodiac-bg-9: #556b2f': '--kerykeion-chart-color-zodiac-bg-9: #6d8a3d',  # Cap - lighter olive
-
-            # Air signs - brighter blues/purples
-            '--kerykeion-chart-color-zodiac-bg-2: #4682b4': '--kerykeion-chart-color-zodiac-bg-2: #5c9fd4',  # Gemini - brighter steel blue
-            '--kerykeion-chart-color-zodiac-bg-6: #6a5acd': '--kerykeion-chart-color-zodiac-bg-6: #8674e0',  # Libra - brighter slate blue
-            '--kerykeion-chart-color-zodiac-bg-10: #5f9ea0': '--kerykeion-chart-color-zodiac-bg-10: #7ab8bb', # Aquarius - brighter cadet blue
-
-            # Water signs - lighter, more luminous
-            '--kerykeion-chart-color-zodiac-bg-3: #20b2aa': '--kerykeion-chart-color-zodiac-bg-3: #3dd4cc',  # Cancer - brighter sea green
-            '--kerykeion-chart-color-zodiac-bg-7: #483d8b': '--kerykeion-chart-color-zodiac-bg-7: #6052ad',  # Scorpio - brighter slate blue
-            '--kerykeion-chart-color-zodiac-bg-11: #4169e1': '--kerykeion-chart-color-zodiac-bg-11: #5b85ff', # Pisces - brighter royal blue
-
-            # Zodiac symbol/icon colors - optimized for dark background readability
-            # Fire signs (Aries, Leo, Sagittarius) - icons 0, 4, 8
-            '--kerykeion-chart-color-zodiac-icon-0: #ff7200': '--kerykeion-chart-color-zodiac-icon-0: #ff9933',   # Fire - bright orange
-            '--kerykeion-chart-color-zodiac-icon-4: #ff7200': '--kerykeion-chart-color-zodiac-icon-4: #ff9933',   # Fire - bright orange
-            '--kerykeion-chart-color-zodiac-icon-8: #ff7200': '--kerykeion-chart-color-zodiac-icon-8: #ff9933',   # Fire - bright orange
-
-            # Earth signs (Taurus, Virgo, Capricorn) - icons 1, 5, 9
-            '--kerykeion-chart-color-zodiac-icon-1: #6b3d00': '--kerykeion-chart-color-zodiac-icon-1: #e6d4aa',   # Earth - bright tan/beige
-            '--kerykeion-chart-color-zodiac-icon-5: #6b3d00': '--kerykeion-chart-color-zodiac-icon-5: #e6d4aa',   # Earth - bright tan/beige
-            '--kerykeion-chart-color-zodiac-icon-9: #6b3d00': '--kerykeion-chart-color-zodiac-icon-9: #e6d4aa',   # Earth - bright tan/beige
-
-            # Air signs (Gemini, Libra, Aquarius) - icons 2, 6, 10
-            '--kerykeion-chart-color-zodiac-icon-2: #69acf1': '--kerykeion-chart-color-zodiac-icon-2: #99ccff',   # Air - bright sky blue
-            '--kerykeion-chart-color-zodiac-icon-6: #69acf1': '--kerykeion-chart-color-zodiac-icon-6: #99ccff',   # Air - bright sky blue
-            '--kerykeion-chart-color-zodiac-icon-10: #69acf1': '--kerykeion-chart-color-zodiac-icon-10: #99ccff', # Air - bright sky blue
-
-            # Water signs (Cancer, Scorpio, Pisces) - icons 3, 7, 11
-            '--kerykeion-chart-color-zodiac-icon-3: #2b4972': '--kerykeion-chart-color-zodiac-icon-3: #8cb3ff',   # Water - bright blue
-            '--kerykeion-chart-color-zodiac-icon-7: #2b4972': '--kerykeion-chart-color-zodiac-icon-7: #8cb3ff',   # Water - bright blue
-            '--kerykeion-chart-color-zodiac-icon-11: #2b4972': '--kerykeion-chart-color-zodiac-icon-11: #8cb3ff', # Water - bright blue
-
-            # Aspect colors - adjusted for dark background visibility
-            '--kerykeion-chart-color-conjunction: #5555ff': '--kerykeion-chart-color-conjunction: #7d7dff',    # Brighter blue
-            '--kerykeion-chart-color-sextile: #ffa500': '--kerykeion-chart-color-sextile: #ffb933',           # Brighter orange
-            '--kerykeion-chart-color-square: #ff0000': '--kerykeion-chart-color-square: #ff4444',              # Softer red
-            '--kerykeion-chart-color-trine: #00ff00': '--kerykeion-chart-color-trine: #33ff33',                # Slightly softer green
-            '--kerykeion-chart-color-opposition: #9932cc': '--kerykeion-chart-color-opposition: #b454e6',      # Brighter orchid
-
-            # Planet and celestial body colors - optimized for dark background readability
-            # Strategy: Convert all dark base colors to bright pastels while preserving color families
-
-            # Major Planets
-            '--kerykeion-chart-color-sun: #984b00': '--kerykeion-chart-color-sun: #ffd966',                   # Dark orange → bright golden yellow
-            '--kerykeion-chart-color-moon: #150052': '--kerykeion-chart-color-moon: #e8e8ff',                 # Dark purple-blue → very light lavender-white
-            '--kerykeion-chart-color-mercury: #520800': '--kerykeion-chart-color-mercury: #ffcc99',           # Dark red-brown → bright peach
-            '--kerykeion-chart-color-venus: #400052': '--kerykeion-chart-color-venus: #ffccff',               # Dark purple → bright pink-lavender
-            '--kerykeion-chart-color-mars: #540000': '--kerykeion-chart-color-mars: #ff9999',                 # Dark red → bright coral-red
-            '--kerykeion-chart-color-jupiter: #47133d': '--kerykeion-chart-color-jupiter: #cc99ff',           # Dark purple → bright purple
-            '--kerykeion-chart-color-saturn: #124500': '--kerykeion-chart-color-saturn: #ccddaa',             # Dark green → bright sage green
-            '--kerykeion-chart-color-uranus: #6f0766': '--kerykeion-chart-color-uranus: #ff99ff',             # Dark magenta → bright magenta-pink
-            '--kerykeion-chart-color-neptune: #06537f': '--kerykeion-chart-color-neptune: #99ccff',           # Dark blue → bright sky blue
-            '--kerykeion-chart-color-pluto: #713f04': '--kerykeion-chart-color-pluto: #ffcc99',               # Dark brown → bright tan-orange
-
-            # Lunar Nodes
-            '--kerykeion-chart-color-mean-node: #4c1541': '--kerykeion-chart-color-mean-node: #ffaa66',       # Dark purple → bright orange
-            '--kerykeion-chart-color-true-node: #4c1541': '--kerykeion-chart-color-true-node: #ffaa66',       # Dark purple → bright orange
-
-            # Chiron & Lilith
-            '--kerykeion-chart-color-chiron: #666f06': '--kerykeion-chart-color-chiron: #ffff99',             # Dark olive → bright yellow-green
-            '--kerykeion-chart-color-mean-lilith: #000000': '--kerykeion-chart-color-mean-lilith: #ff66cc',   # Black → bright magenta-pink
-            '--kerykeion-chart-color-true-lilith: #333333': '--kerykeion-chart-color-true-lilith: #ff66cc',   # Dark gray → bright magenta-pink
-
-            # House Cusps (Angles)
-            '--kerykeion-chart-color-first-house: #ff7e00': '--kerykeion-chart-color-first-house: #ffaa44',   # Orange → bright orange (Ascendant)
-            '--kerykeion-chart-color-fourth-house: #000000': '--kerykeion-chart-color-fourth-house: #cccccc', # Black → light gray (IC)
-            '--kerykeion-chart-color-seventh-house: #0000ff': '--kerykeion-chart-color-seventh-house: #6699ff', # Blue → bright blue (Descendant)
-            '--kerykeion-chart-color-tenth-house: #ff0000': '--kerykeion-chart-color-tenth-house: #ff6666',   # Red → bright red (MC)
-
-            # Lunar Phase - make dark portion visible on dark background
-            '--kerykeion-chart-color-lunar-phase-0: #000000': '--kerykeion-chart-color-lunar-phase-0: #888888', # Dark part: black → medium gray (clearly visible)
-            '--kerykeion-chart-color-lunar-phase-1: #ffffff': '--kerykeion-chart-color-lunar-phase-1: #f5f5f5', # Light part: white → very bright
-
-            # Element percentages - bright, readable colors for dark mode
-            '--kerykeion-chart-color-fire-percentage: #ff6600': '--kerykeion-chart-color-fire-percentage: #ffaa66',     # Fire: orange → bright orange
-            '--kerykeion-chart-color-earth-percentage: #6a2d04': '--kerykeion-chart-color-earth-percentage: #e6c49a',   # Earth: dark brown → bright tan
-            '--kerykeion-chart-color-air-percentage: #6f76d1': '--kerykeion-chart-color-air-percentage: #a0a8ff',       # Air: purple-blue → bright periwinkle
-            '--kerykeion-chart-color-water-percentage: #630e73': '--kerykeion-chart-color-water-percentage: #dd99ff',   # Water: dark purple → bright lavender
-        }
-
-        # Apply dark theme colors
-        for old_color, new_color in color_map.items():
-            svg_content = svg_content.replace(old_color, new_color)
-
-        # Adjust background style attribute
-        svg_content = re.sub(
-            r"style='background-color: var\(--kerykeion-chart-color-paper-1\)'",
-            r"style='background-color: var(--kerykeion-chart-color-paper-1)'",
-            svg_content
-        )
+        # Apply dark theme colors in a single pass over the document
+        svg_content = _DARK_COLOR_RE.sub(lambda m: _DARK_COLOR_MAP[m.group(0)], svg_content)
 
     # Light theme is already applied by default from Kerykeion
     return svg_content
@@ -145,55 +348,53 @@ def enhance_typography(svg_content):
     - Data values: 20px/400 (large, clear)
     - Metadata: 20px/400 (consistent with data)
     """
+    # Font size rewrites are plain literals, so str.replace beats the regex engine
     # Enhance title: larger and bolder
-    svg_content = re.sub(
-        r"font-size: 28px; font-weight: 600",
-        r"font-size: 40px; font-weight: 700; letter-spacing: -0.3px",
-        svg_content
+    svg_content = svg_content.replace(
+        "font-size: 28px; font-weight: 600",
+        "font-size: 40px; font-weight: 700; letter-spacing: -0.3px"
     )
 
     # Make section labels semibold (Elements:, Qualities:, planet names, cusp labels)
     # Elements and Qualities headers
-    svg_content = re.sub(
-        r"(<text[^>]*>)(Elements:|Qualities:)",
+    svg_content = _SECTION_LABEL_RE.sub(
         r"\1<tspan style='font-weight: 600'>\2</tspan>",
         svg_content
     )
 
     # Planet names in grid (Sun, Moon, etc.) - make semibold
-    for planet in ['Sun:', 'Moon:', 'Mercury:', 'Venus:', 'Mars:', 'Jupiter:', 'Saturn:',
-                   'Uranus:', 'Neptune:', 'Pluto:', 'N. Node:', 'S. Node:']:
-        svg_content = re.sub(
-            rf"(<text[^>]*>){planet}",
-            rf"\1<tspan style='font-weight: 600'>{planet}</tspan>",
-            svg_content
-        )
+    svg_content = _PLANET_LABEL_RE.sub(
+        r"\1<tspan style='font-weight: 600'>\2</tspan>",
+        svg_content
+    )
 
     # House cusp labels - make semibold
-    for i in range(1, 13):
-        svg_content = re.sub(
-            rf"(<text[^>]*>)(Cusp {i}:)",
-            rf"\1<tspan style='font-weight: 600'>\2</tspan>",
-            svg_content
-        )
-
-    # Increase base font size for screen readability (9px → 18px)
-    svg_content = re.sub(
-        r"font-size: 9px",
-        r"font-size: 18px",
+    svg_content = _CUSP_LABEL_RE.sub(
+        r"\1<tspan style='font-weight: 600'>\2</tspan>",
         svg_content
     )
 
+    # Increase base font size for screen readability (9px → 18px)
+    svg_content = svg_content.replace("font-size: 9px", "font-size: 18px")
+
     # Also increase 10px text to 18px for consistency
-    svg_content = re.sub(
-        r"font-size: 10px",
-        r"font-size: 18px",
-        svg_content
-    )
+    svg_content = svg_content.replace("font-size: 10px", "font-size: 18px")
 
     return svg_content
 
 
+@functools.lru_cache(maxsize=4096)
+def _scale_spacing(y_val_str):
+    # Grid rows repeat the same handful of offsets, so memoize the
+    # int/round/str round-trip per distinct value
+    y_val = int(y_val_str)
+    if y_val == 0:
+        return y_val_str
+    # Scale up: 10→19, 24→45, 38→71, 52→97, etc.
+    new_y = round(y_val * 1.86)
+    return str(new_y)
+
+
 def adjust_grid_spacing(svg_content):
     """Adjust vertical spacing in grids to accommodate larger 18px font.
 
@@ -201,84 +402,71 @@ def adjust_grid_spacing(svg_content):
     New spacing for 18px text needs ~26px line height for readability.
     Scale factor: 26/14 ≈ 1.86
     """
-    def scale_spacing(y_val_str):
-        y_val = int(y_val_str)
-        if y_val == 0:
-            return y_val_str
-        # Scale up: 10→19, 24→45, 38→71, 52→97, etc.
-        new_y = round(y_val * 1.86)
-        return str(new_y)
-
     # Extract and adjust Main_Planet_Grid section
-    planet_grid_match = re.search(
-        r"(<g kr:node='Main_Planet_Grid'[^>]*>)(.*?)(</g>\s*<!-- 7\. House Cusps)",
-        svg_content,
-        re.DOTALL
-    )
-    if planet_grid_match:
-        prefix = planet_grid_match.group(1)
-        grid_content = planet_grid_match.group(2)
-        suffix = planet_grid_match.group(3)
+    planet_grid_span = _find_group_span(svg_content, "<g kr:node='Main_Planet_Grid'", '<!-- 7. House Cusps')
+    if planet_grid_span:
+        _, start, end = planet_grid_span
+        grid_content = svg_content[start:end]
 
         # Adjust all translate(0,Y) in this section
-        grid_content = re.sub(
-            r"translate\(0,(\d+)\)",
-            lambda m: f"translate(0,{scale_spacing(m.group(1))})",
+        grid_content = _TRANSLATE_Y_RE.sub(
+            lambda m: f"translate(0,{_scale_spacing(m.group(1))})",
             grid_content
         )
 
-        svg_content = svg_content.replace(planet_grid_match.group(0), prefix + grid_content + suffix)
+        svg_content = svg_content[:start] + grid_content + svg_content[end:]
 
     # House cusps grid
-    svg_content = re.sub(
-        r"(<g transform='translate\(0,)(\d+)(\)'><text[^>]*><tspan[^>]*>Cusp)",
-        lambda m: m.group(1) + scale_spacing(m.group(2)) + m.group(3),
+    svg_content = _CUSP_ROW_TRANSLATE_RE.sub(
+        lambda m: m.group(1) + _scale_spacing(m.group(2)) + m.group(3),
         svg_content
     )
 
     # Extract and adjust Elements_Percentages section (uses y='...' not translate)
-    elements_match = re.search(
-        r"(<g kr:node='Elements_Percentages'[^>]*>)(.*?)(</g>\s*<!-- 9\. Qualities)",
-        svg_content,
-        re.DOTALL
-    )
-    if elements_match:
-        prefix = elements_match.group(1)
-        grid_content = elements_match.group(2)
-        suffix = elements_match.group(3)
+    elements_span = _find_group_span(svg_content, "<g kr:node='Elements_Percentages'", '<!-- 9. Qualities')
+    if elements_span:
+        _, start, end = elements_span
+        grid_content = svg_content[start:end]
 
         # Adjust y='...' attributes (not translate)
-        grid_content = re.sub(
-            r"\sy='(\d+)'",
-            lambda m: f" y='{scale_spacing(m.group(1))}'",
+        grid_content = _Y_ATTR_RE.sub(
+            lambda m: f" y='{_scale_spacing(m.group(1))}'",
             grid_content
         )
 
-        svg_content = svg_content.replace(elements_match.group(0), prefix + grid_content + suffix)
+        svg_content = svg_content[:start] + grid_content + svg_content[end:]
 
     # Extract and adjust Qualities_Percentages section (uses y='...' not translate)
-    qualities_match = re.search(
-        r"(<g kr:node='Qualities_Percentages'[^>]*>)(.*?)(</g>\s*<!-- 10\. Aspect List)",
-        svg_content,
-        re.DOTALL
-    )
-    if qualities_match:
-        prefix = qualities_match.group(1)
-        grid_content = qualities_match.group(2)
-        suffix = qualities_match.group(3)
+    qualities_span = _find_group_span(svg_content, "<g kr:node='Qualities_Percentages'", '<!-- 10. Aspect List')
+    if qualities_span:
+        _, start, end = qualities_span
+        grid_content = svg_content[start:end]
 
         # Adjust y='...' attributes (not translate)
-        grid_content = re.sub(
-            r"\sy='(\d+)'",
-            lambda m: f" y='{scale_spacing(m.group(1))}'",
+        grid_content = _Y_ATTR_RE.sub(
+            lambda m: f" y='{_scale_spacing(m.group(1))}'",
             grid_content
         )
 
-        svg_content = svg_content.replace(qualities_match.group(0), prefix + grid_content + suffix)
+        svg_content = svg_content[:start] + grid_content + svg_content[end:]
 
     return svg_content
 
 
+def _scale_grid_symbol(match):
+    if match.group(1):
+        return f"<use transform='scale(0.77)' xlink:href='#{match.group(1)}' />"
+    if match.group(2):
+        return f"<use transform='scale(0.50)' xlink:href='#{match.group(2)}' />"
+    return "<use transform='scale(0.85)' xlink:href='#retrograde'"
+
+
+def _position_grid_symbol(match):
+    if match.group(1):
+        return match.group(1) + "x='42'"
+    return _GRID_SYMBOL_TRANSLATES[match.group(0)]
+
+
 def scale_grid_symbols(svg_content):
     """Scale zodiac symbols and adjust positions to match larger 18px text.
 
@@ -286,88 +474,32 @@ def scale_grid_symbols(svg_content):
     Planet symbols: 0.4 → 0.77
     Zodiac symbols: 0.3 → 0.55
     """
-    # Scale planet symbols in planetary grid (0.4 → 0.77)
-    svg_content = re.sub(
-        r"<use transform='scale\(0\.4\)' xlink:href='#(Sun|Moon|Mercury|Venus|Mars|Jupiter|Saturn|Uranus|Neptune|Pluto|True_North_Lunar_Node|Chiron|Ascendant|Medium_Coeli|Descendant|Imum_Coeli|Mean_Lilith|True_South_Lunar_Node)' />",
-        r"<use transform='scale(0.77)' xlink:href='#\1' />",
-        svg_content
-    )
-
-    # Adjust planet symbol position in planetary grid
-    # translate(5,-8) × (0.77/0.4) ≈ translate(10,-15)
-    svg_content = re.sub(
-        r"<g transform='translate\(5,-8\)'><use transform='scale\(0\.77\)'",
-        r"<g transform='translate(10,-15)'><use transform='scale(0.77)'",
-        svg_content
-    )
-
-    # Adjust degree text position in planetary grid
-    svg_content = re.sub(
-        r"(scale\(0\.77\)' xlink:href='#[^']+' /></g><text text-anchor='start' )x='19'",
-        r"\1x='42'",
-        svg_content
-    )
-
-    # Scale zodiac symbols in planetary grid (0.3 → 0.50)
-    svg_content = re.sub(
-        r"<use transform='scale\(0\.3\)' xlink:href='#(Ari|Tau|Gem|Can|Leo|Vir|Lib|Sco|Sag|Cap|Aqu|Pis)' />",
-        r"<use transform='scale(0.50)' xlink:href='#\1' />",
-        svg_content
-    )
-
-    # Adjust zodiac symbol horizontal position to accommodate wider text
-    svg_content = re.sub(
-        r"<g transform='translate\(75,-8\)'><use transform='scale\(0\.50\)'",
-        r"<g transform='translate(126,-15)'><use transform='scale(0.50)'",
-        svg_content
-    )
-
-    # Adjust retrograde symbol scale and position (0.5 → 0.85)
-    svg_content = re.sub(
-        r"<use transform='scale\(\.5\)' xlink:href='#retrograde'",
-        r"<use transform='scale(0.85)' xlink:href='#retrograde'",
+    # Scale planet (0.4 → 0.77), zodiac (0.3 → 0.50) and retrograde (0.5 → 0.85)
+    # symbols in one pass. The zodiac rewrite also covers the house cusp grid.
+    svg_content = _GRID_SYMBOL_SCALE_RE.sub(_scale_grid_symbol, svg_content)
+
+    # Move the rescaled symbols and the planet degree text in one pass:
+    # planet translate(5,-8) × (0.77/0.4) ≈ translate(10,-15), zodiac to x=126
+    # to accommodate wider text, retrograde to x=141, degree text to x=42
+    svg_content = _GRID_SYMBOL_POS_RE.sub(_position_grid_symbol, svg_content)
+
+    # House cusp symbols: match any existing translate pattern in house cusps
+    # grid (near "Cusp X:"), adjust for 18px text and move to x=75
+    svg_content = _CUSP_SYMBOL_POS_RE.sub(
+        r"\1<g transform='translate(75,-15)'>",
         svg_content
     )
 
-    # Adjust retrograde position
-    svg_content = re.sub(
-        r"<g transform='translate\(89,-6\)'><use transform='scale\(0\.85\)'",
-        r"<g transform='translate(141,-13)'><use transform='scale(0.85)'",
-        svg_content
-    )
-
-    # House cusp symbols: scale to 0.50 (matching planetary grid zodiac) and adjust position
-    # Find in house cusps grid specifically
-    def fix_house_cusp_symbols(content):
-        # First update scale from 0.3 to 0.50
-        content = re.sub(
-            r"(<g transform='translate\([^)]+\)'>)<use transform='scale\(0\.3\)' xlink:href='#(Ari|Tau|Gem|Can|Leo|Vir|Lib|Sco|Sag|Cap|Aqu|Pis)' />",
-            r"\1<use transform='scale(0.50)' xlink:href='#\2' />",
-            content
-        )
-        # Pattern: match any existing translate pattern in house cusps grid (near "Cusp X:")
-        # Adjust for 18px text and move to x=75
-        content = re.sub(
-            r"(Cusp \d+:</tspan></text>)<g transform='translate\([^)]+\)'>",
-            r"\1<g transform='translate(75,-15)'>",
-            content
-        )
-        return content
-
-    svg_content = fix_house_cusp_symbols(svg_content)
-
     # Adjust house cusp degree text position within house grid
     # Adjust for 18px text - move degrees to x=103 and remove leading space
     # Only target text after cusp labels
     def adjust_cusp_degree_position(match):
         # Replace any x='number' with x='103' and remove leading space
-        import re
-        result = re.sub(r"x='\d+'", "x='103'", match.group(0))
-        result = re.sub(r"(>)\s+(\d+°)", r"\1\2", result)  # Remove space after >
+        result = _CUSP_X_NUM_RE.sub("x='103'", match.group(0))
+        result = _CUSP_DEG_SPACE_RE.sub(r"\1\2", result)  # Remove space after >
         return result
 
-    svg_content = re.sub(
-        r"(Cusp \d+:.*?)<text x='\d+'[^>]*>\s*\d+°\d+'\d+'</text>",
+    svg_content = _CUSP_DEGREE_TEXT_RE.sub(
         adjust_cusp_degree_position,
         svg_content
     )
@@ -375,190 +507,71 @@ def scale_grid_symbols(svg_content):
     return svg_content
 
 
-def enhance_wheel_aesthetics(svg_content, theme='light'):
-    """Enhance the zodiac wheel with refined visual styling.
+def enhance_aesthetics(svg_content, theme='light'):
+    """Enhance the zodiac wheel and aspect grid with refined visual styling.
 
     Args:
         theme: 'light' or 'dark' - adjusts shadow/glow for background
 
     Improvements:
-    - Add subtle drop shadow (light) or glow (dark) to wheel
+    - Add subtle drop shadow (light) or glow (dark) to wheel and aspect grid
     - Increase planet symbol size
-    - Refine aspect line weights
+    - Refine aspect line weights and cell borders
     """
-    # Choose filter based on theme
-    if theme == 'dark':
-        # Dark mode: subtle glow instead of shadow
-        filter_def = """
-    <!-- Enhanced wheel styling (dark mode) -->
-    <defs>
-        <filter id="wheel-effect" x="-50%" y="-50%" width="200%" height="200%">
-            <feGaussianBlur stdDeviation="2" result="coloredBlur"/>
-            <feComponentTransfer>
-                <feFuncA type="linear" slope="0.4"/>
-            </feComponentTransfer>
-            <feMerge>
-                <feMergeNode in="coloredBlur"/>
-                <feMergeNode in="SourceGraphic"/>
-            </feMerge>
-        </filter>
-    </defs>"""
-    else:
-        # Light mode: traditional drop shadow
-        filter_def = """
-    <!-- Enhanced wheel styling (light mode) -->
-    <defs>
-        <filter id="wheel-effect" x="-50%" y="-50%" width="200%" height="200%">
-            <feGaussianBlur in="SourceAlpha" stdDeviation="3"/>
-            <feOffset dx="0" dy="2" result="offsetblur"/>
-            <feComponentTransfer>
-                <feFuncA type="linear" slope="0.3"/>
-            </feComponentTransfer>
-            <feMerge>
-                <feMergeNode/>
-                <feMergeNode in="SourceGraphic"/>
-            </feMerge>
-        </filter>
-    </defs>"""
-
-    # Insert filter after the first defs section
-    svg_content = re.sub(
-        r"(</defs>)",
-        r"\1\n    " + filter_def,
+    # Both filters share one defs block, inserted after the first defs section
+    combined_defs = _AESTHETIC_DEFS['dark' if theme == 'dark' else 'light']
+    svg_content = _DEFS_CLOSE_RE.sub(
+        lambda m: m.group(1) + "\n    " + combined_defs,
         svg_content,
         count=1
     )
 
-    # Apply effect filter to the wheel
-    svg_content = re.sub(
-        r"(<g kr:node='Full_Wheel'[^>]*>)",
-        r"\1\n        <g style='filter: url(#wheel-effect)'>",
+    # Apply effect filters to the wheel, aspect list and aspect grid in one sweep
+    svg_content = _EFFECT_GROUP_OPEN_RE.sub(
+        lambda m: m.group(0) + _EFFECT_WRAPPERS[m.group(1)],
         svg_content
     )
 
-    # Close the filter group at the end of Full_Wheel
-    # Pattern now accounts for header section between wheel and planetary grid
-    svg_content = re.sub(
-        r"(</g>\s*<!-- Minimal header)",
-        r"</g>\n    \1",
-        svg_content
-    )
+    # Close the filter groups: the wheel ends before the header, the aspect
+    # list before the aspect grid, and the aspect grid at the end of the SVG
+    svg_content = _EFFECT_GROUP_CLOSE_RE.sub(_close_effect_group, svg_content)
 
     # Make planet symbols in the wheel slightly larger (0.4 -> 0.45 scale)
     # Only target symbols within the zodiac ring, not in grids
     # Pattern now accounts for header section between wheel and planetary grid
-    wheel_section_match = re.search(
-        r"(<g kr:node='Full_Wheel'.*?</g>\s*<!-- Minimal header)",
-        svg_content,
-        re.DOTALL
-    )
+    wheel_span = _find_group_span(svg_content, "<g kr:node='Full_Wheel'", '<!-- Minimal header')
 
-    if wheel_section_match:
-        wheel_section = wheel_section_match.group(1)
+    if wheel_span:
+        start, _, end = wheel_span
         # Increase planet symbol scale within wheel
-        wheel_section = re.sub(
-            r"transform='scale\(0\.4\)'",
-            r"transform='scale(0.45)'",
-            wheel_section
+        wheel_section = svg_content[start:end].replace(
+            "transform='scale(0.4)'", "transform='scale(0.45)'"
         )
-        svg_content = svg_content.replace(wheel_section_match.group(1), wheel_section)
+        svg_content = svg_content[:start] + wheel_section + svg_content[end:]
 
     # Make aspect lines slightly more prominent
-    svg_content = re.sub(
-        r"(--kerykeion-chart-color-conjunction: #[0-9a-fA-F]{6})",
+    svg_content = _CONJUNCTION_COLOR_RE.sub(
         r"\1; stroke-width: 1.5",
         svg_content
     )
 
-    return svg_content
-
-
-def enhance_aspect_grid_aesthetics(svg_content, theme='light'):
-    """Enhance the aspect grid with refined visual styling.
-
-    Args:
-        theme: 'light' or 'dark' - adjusts shadow/glow for background
-
-    Improvements:
-    - Add subtle drop shadow (light) or glow (dark) to grid
-    - Refine cell borders
-    - Enhance aspect symbols
-    """
-    # Choose filter based on theme
-    if theme == 'dark':
-        # Dark mode: subtle glow
-        filter_def = """
-    <!-- Enhanced aspect grid styling (dark mode) -->
-    <filter id="aspect-grid-effect" x="-10%" y="-10%" width="120%" height="120%">
-        <feGaussianBlur stdDeviation="1.5" result="coloredBlur"/>
-        <feComponentTransfer>
-            <feFuncA type="linear" slope="0.3"/>
-        </feComponentTransfer>
-        <feMerge>
-            <feMergeNode in="coloredBlur"/>
-            <feMergeNode in="SourceGraphic"/>
-        </feMerge>
-    </filter>"""
-    else:
-        # Light mode: traditional drop shadow
-        filter_def = """
-    <!-- Enhanced aspect grid styling (light mode) -->
-    <filter id="aspect-grid-effect" x="-10%" y="-10%" width="120%" height="120%">
-        <feGaussianBlur in="SourceAlpha" stdDeviation="2"/>
-        <feOffset dx="0" dy="1" result="offsetblur"/>
-        <feComponentTransfer>
-            <feFuncA type="linear" slope="0.2"/>
-        </feComponentTransfer>
-        <feMerge>
-            <feMergeNode/>
-            <feMergeNode in="SourceGraphic"/>
-        </feMerge>
-    </filter>"""
-
-    # Insert filter after existing defs
-    svg_content = re.sub(
-        r"(<!-- Enhanced wheel styling.*?</filter>)",
-        r"\1\n    " + filter_def,
-        svg_content,
-        flags=re.DOTALL
-    )
-
-    # Apply effect filter to both aspect list and aspect grid
-    svg_content = re.sub(
-        r"(<g kr:node='Aspect_List'[^>]*>)",
-        r"\1\n        <g style='filter: url(#aspect-grid-effect)'>",
-        svg_content
-    )
-
-    svg_content = re.sub(
-        r"(<g kr:node='Aspect_Grid'[^>]*>)",
-        r"\1\n        <g style='filter: url(#aspect-grid-effect)'>",
-        svg_content
-    )
-
-    # Close the filter groups
-    svg_content = re.sub(
-        r"(</g>\s*<!-- 11\. Aspect Grid)",
-        r"</g>\1",
-        svg_content
-    )
-
-    svg_content = re.sub(
-        r"(</svg>)",
-        r"</g>\1",
-        svg_content
-    )
-
     # Refine cell borders - make them slightly more subtle but still visible
-    svg_content = re.sub(
-        r"stroke-width: 1px; stroke-width: 0\.5px",
-        r"stroke-width: 0.6px; stroke-opacity: 0.8",
-        svg_content
+    svg_content = svg_content.replace(
+        "stroke-width: 1px; stroke-width: 0.5px", "stroke-width: 0.6px; stroke-opacity: 0.8"
     )
 
     return svg_content
 
 
+def _close_effect_group(match):
+    if match.group(0) == '</svg>':
+        return '</g></svg>'
+    if match.group(1) == 'Minimal header':
+        return '</g>\n    ' + match.group(0)
+    return '</g>' + match.group(0)
+
+
+@functools.lru_cache(maxsize=32)
 def create_minimal_header(title_text, location_content, lunar_text, moon_graphic, theme='light'):
     """Create a minimal, centered header with essential birth info and moon phase.
 
@@ -585,23 +598,24 @@ def create_minimal_header(title_text, location_content, lunar_text, moon_graphic
         name = "Natal Chart"  # Fallback if no name provided
 
     # Extract location (e.g., "Location: South Williamson, US")
-    location_match = re.search(r"Location:\s*([^<]+)", location_content)
+    location_match = _HEADER_LOCATION_RE.search(location_content)
     location = location_match.group(1).strip() if location_match else "Unknown"
 
     # Extract date/time (e.g., "1978-09-18 17:34 [-04:00]")
-    datetime_match = re.search(r"(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})", location_content)
+    datetime_match = _HEADER_DATETIME_RE.search(location_content)
     if datetime_match:
         date_raw = datetime_match.group(1)  # "1978-09-18"
         time_raw = datetime_match.group(2)  # "17:34"
 
         # Convert date to readable format: "1978-09-18" → "September 18, 1978"
-        from datetime import datetime
-        date_obj = datetime.strptime(date_raw, "%Y-%m-%d")
+        date_obj = date.fromisoformat(date_raw)
         date_formatted = date_obj.strftime("%B %d, %Y")
 
         # Convert time to 12-hour format: "17:34" → "5:34 PM"
-        time_obj = datetime.strptime(time_raw, "%H:%M")
-        time_formatted = time_obj.strftime("%-I:%M %p")  # %-I removes leading zero
+        # Formatted by hand: strftime's %-I (no leading zero) isn't portable to Windows
+        time_obj = time.fromisoformat(time_raw)
+        hour_12 = (time_obj.hour - 1) % 12 + 1
+        time_formatted = f"{hour_12}:{time_obj.minute:02d} {'PM' if time_obj.hour >= 12 else 'AM'}"
     else:
         date_formatted = "Date Unknown"
         time_formatted = ""
@@ -632,107 +646,132 @@ def create_minimal_header(title_text, location_content, lunar_text, moon_graphic
     return header_svg
 
 
-def build_portrait_chart(landscape_svg, theme='light'):
-    """Build portrait chart with enhanced typography and wheel aesthetics.
+def _adjust_scaled_use(match):
+    scale = float(match.group(1))
+    x_val = float(match.group(2))
+    y_val = float(match.group(3))
+    href = match.group(4)
 
-    Args:
-        theme: 'light' (white bg, for print) or 'dark' (dark bg, for screen)
+    # The x/y coordinates are in scaled coordinate space
+    # Convert to actual position: x_actual = x_val * scale
+    # Then subtract base offset and convert back to scaled space
+    # Formula: new_x = (x_val * scale - offset) / scale
+    actual_x = x_val * scale  # Convert to actual pixels
+    actual_y = y_val * scale
+
+    adjusted_x = actual_x - 510  # Subtract landscape base offset
+    adjusted_y = actual_y - 230
+
+    new_x = adjusted_x / scale  # Convert back to scaled coordinate space
+    new_y = adjusted_y / scale
+
+    return f"<use transform='scale({scale})' x='{new_x}' y='{new_y}' xlink:href='{href}' />"
 
-    Elements included:
-    1. Minimal header - centered (name, date/time/location, moon phase)
-    2. Wheel - centered with shadow/glow and refined styling
-    3. Planetary grid, house cusps, elements, qualities, aspects
-    """
 
+def _adjust_coord(match):
+    attr = match.group(1)
+    value = float(match.group(2))
+    if attr == 'x' and value >= 510:
+        new_value = value - 510
+        return f"x='{new_value:.1f}'" if '.' in match.group(2) else f"x='{int(new_value)}'"
+    elif attr == 'y' and value >= 230:
+        new_value = value - 230
+        return f"y='{new_value:.1f}'" if '.' in match.group(2) else f"y='{int(new_value)}'"
+    return match.group(0)
+
+
+def _adjust_aspect_coords(content):
+    """Adjust aspect grid coordinates from absolute to relative.
+
+    Subtract base offsets (x: 510, y: 230) to make coordinates relative to container.
+    """
+    # Scaled use tags get their own adjustment; plain x/y attributes are only
+    # adjusted in the text between them, so no tag is shifted twice
+    pieces = []
+    pos = 0
+    for match in _SCALED_USE_RE.finditer(content):
+        pieces.append(_COORD_RE.sub(_adjust_coord, content[pos:match.start()]))
+        pieces.append(_adjust_scaled_use(match))
+        pos = match.end()
+    pieces.append(_COORD_RE.sub(_adjust_coord, content[pos:]))
+
+    return ''.join(pieces)
+
+
+@dataclass(frozen=True)
+class _LandscapeParts:
+    """Theme-independent fragments extracted from a Kerykeion landscape SVG."""
+    style: str
+    defs: str
+    title_text: str
+    location_content: str
+    lunar_text: str
+    moon_graphic: str
+    wheel_content: str
+    planet_grid_content: str
+    houses_grid_content: str
+    elements_content: str
+    qualities_content: str
+    aspect_grid_content: str
+    aspect_list_content: str
+
+
+@functools.lru_cache(maxsize=8)
+def _extract_landscape(landscape_svg):
+    """Extract and reposition every fragment the portrait layout needs.
+
+    Nothing here depends on the theme, so the light and dark builds of the
+    same landscape share one extraction.
+    """
     # Extract style (CSS colors, fonts)
-    style = extract_section(landscape_svg, r'(<style[^>]*>.*?</style>)')
+    style = extract_section(landscape_svg, _STYLE_SECTION_RE)
 
     # Add SF Pro font family if not already present
     if 'SF Pro' not in style:
-        style = style.replace('<style', '<style', 1).replace('>', '>\n        text { font-family: \'SF Pro\', \'SF Pro Display\', \'-apple-system\', \'Helvetica Neue\', sans-serif; }\n        ', 1)
+        style = style.replace('>', '>' + _FONT_FAMILY_DECL, 1)
 
     # Extract ALL defs sections (there may be multiple - one with clipPaths, one with symbols)
-    defs_matches = re.findall(r'(<defs[^>]*>.*?</defs>)', landscape_svg, re.DOTALL)
+    defs_matches = _DEFS_SECTION_RE.findall(landscape_svg)
     defs = '\n    '.join(defs_matches) if defs_matches else ''
 
     # 1. Extract title text
-    title_match = re.search(r"kr:node='Chart_Title'[^>]*>([^<]+)<", landscape_svg)
+    title_match = _CHART_TITLE_RE.search(landscape_svg)
     title_text = title_match.group(1) if title_match else 'Birth Chart'
 
-    # Helper function to extract group content with proper nesting
-    def extract_group_content(svg, node_name):
-        """Extract content between opening and closing g tags, handling nested groups."""
-        # Find the opening tag
-        pattern = rf"<g kr:node='{node_name}'[^>]*>"
-        match = re.search(pattern, svg)
-        if not match:
-            return ''
-
-        start = match.end()
-        depth = 1
-        pos = start
-
-        # Track nested <g> and </g> tags
-        while pos < len(svg) and depth > 0:
-            next_open = svg.find('<g ', pos)
-            next_close = svg.find('</g>', pos)
-
-            if next_close == -1:
-                break
-
-            if next_open != -1 and next_open < next_close:
-                depth += 1
-                pos = next_open + 1
-            else:
-                depth -= 1
-                if depth == 0:
-                    return svg[start:next_close]
-                pos = next_close + 4
-
-        return ''
-
     # 2. Extract zodiacal information and fix y-coordinates
     zodiac_content = extract_group_content(landscape_svg, 'Bottom_Left_Text')
     # Remove any Chart_Title elements (not part of zodiacal metadata)
-    zodiac_content = re.sub(r"<text[^>]*kr:node='Chart_Title'[^>]*>.*?</text>", '', zodiac_content, flags=re.DOTALL)
+    zodiac_content = _CHART_TITLE_TEXT_RE.sub('', zodiac_content)
 
     # Extract lunation/lunar text separately for moon phase section
-    lunation_match = re.search(r"<text kr:node='Bottom_Left_Text_2'[^>]*>(Lunation Day:[^<]+)</text>", zodiac_content)
-    lunar_match = re.search(r"<text kr:node='Bottom_Left_Text_3'[^>]*>(Lunar phase:[^<]+)</text>", zodiac_content)
+    lunation_match = _LUNATION_TEXT_RE.search(zodiac_content)
+    lunar_match = _LUNAR_PHASE_TEXT_RE.search(zodiac_content)
     lunation_text = lunation_match.group(1) if lunation_match else 'Lunation Day: —'
     lunar_text = lunar_match.group(1) if lunar_match else 'Lunar phase: —'
 
     # Remove lunation/lunar text from zodiac_content (they'll go in moon phase section)
-    zodiac_content = re.sub(r"<text kr:node='Bottom_Left_Text_[23]'[^>]*>.*?</text>", '', zodiac_content)
+    zodiac_content = _LUNAR_TEXTS_RE.sub('', zodiac_content)
 
     # Only keep Bottom_Left_Text_0, 1, 4 (zodiacal info without lunation)
     # Adjust y-coordinates from landscape (452, 466, 508) to portrait (0, 15, 30)
-    zodiac_content = re.sub(r"y='452'", "y='0'", zodiac_content)
-    zodiac_content = re.sub(r"y='466'", "y='15'", zodiac_content)
-    zodiac_content = re.sub(r"y='508'", "y='30'", zodiac_content)
-    # Adjust x-coordinates to 0 (positioning handled by group transform at translate(10,40))
-    zodiac_content = re.sub(r" x='20'", " x='0'", zodiac_content)
+    # and x-coordinates to 0 (positioning handled by group transform at translate(10,40))
+    zodiac_content = _ZODIAC_COORD_RE.sub(lambda m: _ZODIAC_COORDS[m.group(0)], zodiac_content)
 
     # 3. Extract location metadata and fix y-coordinates
     location_content = extract_group_content(landscape_svg, 'Top_Left_Text')
     # Remove any Chart_Title elements (not part of location metadata)
-    location_content = re.sub(r"<text[^>]*kr:node='Chart_Title'[^>]*>.*?</text>", '', location_content, flags=re.DOTALL)
+    location_content = _CHART_TITLE_TEXT_RE.sub('', location_content)
 
     # Note: Location is already combined in landscape.svg by _combine_location_line()
 
     # Adjust y-coordinates from landscape to portrait
     # Location line is already combined in landscape by _combine_location_line()
-    location_content = re.sub(r"y='58'", "y='0'", location_content)   # Location
-    location_content = re.sub(r"y='70'", "y='15'", location_content)  # Latitude
-    location_content = re.sub(r"y='82'", "y='30'", location_content)  # Longitude
-    location_content = re.sub(r"y='94'", "y='45'", location_content)  # Date/Time
-    location_content = re.sub(r"y='106'", "y='60'", location_content) # Day of Week
-    # Adjust x-coordinates to 0 (positioning handled by group transform at translate(790,40))
-    location_content = re.sub(r" x='20'", " x='0'", location_content)
+    # Location, Latitude, Longitude, Date/Time, Day of Week
+    # and x-coordinates to 0 (positioning handled by group transform at translate(790,40))
+    location_content = _LOCATION_COORD_RE.sub(lambda m: _LOCATION_COORDS[m.group(0)], location_content)
 
     # Make location text right-aligned
-    location_content = re.sub(
-        r"(<text[^>]*kr:node='Top_Left_Text_[0-9]+'[^>]*)>",
+    location_content = _TOP_LEFT_TEXT_OPEN_RE.sub(
         r"\1 text-anchor='end'>",
         location_content
     )
@@ -740,157 +779,109 @@ def build_portrait_chart(landscape_svg, theme='light'):
     # 4. Extract moon phase graphic for minimal header
     moon_graphic = extract_group_content(landscape_svg, 'Lunar_Phase')
 
-    # Create minimal header (theme-aware: dark mode omits name, light mode includes it)
-    minimal_header = create_minimal_header(title_text, location_content, lunar_text, moon_graphic, theme)
-
     # 5. Extract wheel
     wheel_content = extract_group_content(landscape_svg, 'Full_Wheel')
 
     # 6. Extract planetary positions grid using proper nested extraction
     planet_grid_raw = extract_group_content(landscape_svg, 'Main_Planet_Grid')
     # Remove the outer translate wrapper from landscape layout
-    planet_grid_match = re.search(
-        r"<g transform='translate\([^)]+\)'>(.*)</g>",
-        planet_grid_raw,
-        re.DOTALL
-    )
+    planet_grid_match = _TRANSLATE_WRAPPER_RE.search(planet_grid_raw)
     planet_grid_content = planet_grid_match.group(1) if planet_grid_match else planet_grid_raw
 
     # Move zodiac sign icons further right to avoid clipping degree text
     # Sign icons: translate(60,-8) → translate(75,-8)
-    planet_grid_content = re.sub(
-        r"<g transform='translate\(60,-8\)'>",
-        r"<g transform='translate(75,-8)'>",
-        planet_grid_content
+    planet_grid_content = planet_grid_content.replace(
+        "<g transform='translate(60,-8)'>", "<g transform='translate(75,-8)'>"
     )
 
     # Move retrograde indicators proportionally
     # Retrograde: translate(74,-6) → translate(89,-6) (maintains 14px offset)
-    planet_grid_content = re.sub(
-        r"<g transform='translate\(74,-6\)'>",
-        r"<g transform='translate(89,-6)'>",
-        planet_grid_content
+    planet_grid_content = planet_grid_content.replace(
+        "<g transform='translate(74,-6)'>", "<g transform='translate(89,-6)'>"
     )
 
     # 7. Extract house cusps grid
     houses_grid_raw = extract_group_content(landscape_svg, 'Main_Houses_Grid')
     # Remove the outer translate wrapper from landscape layout
-    houses_grid_match = re.search(
-        r"<g transform='translate\([^)]+\)'>(.*)</g>",
-        houses_grid_raw,
-        re.DOTALL
-    )
+    houses_grid_match = _TRANSLATE_WRAPPER_RE.search(houses_grid_raw)
     houses_grid_content = houses_grid_match.group(1) if houses_grid_match else houses_grid_raw
 
     # Remove non-breaking spaces from cusp labels
-    houses_grid_content = re.sub(r"Cusp\s*(?:&#160;)*(\d+):", r"Cusp \1:", houses_grid_content)
+    houses_grid_content = _CUSP_NBSP_RE.sub(r"Cusp \1:", houses_grid_content)
 
     # Change cusp labels to left-aligned
-    houses_grid_content = re.sub(r"text-anchor='end'", r"text-anchor='start'", houses_grid_content)
+    houses_grid_content = houses_grid_content.replace("text-anchor='end'", "text-anchor='start'")
     # Change x from 40 to 0 for left alignment
-    houses_grid_content = re.sub(r"(<text text-anchor='start' )x='40'", r"\1x='0'", houses_grid_content)
+    houses_grid_content = _CUSP_LABEL_X_RE.sub(r"\1x='0'", houses_grid_content)
 
     # Add padding around zodiac sign symbols in cusps
     # Move sign symbols: translate(40,-8) → translate(64,-12) (24px padding, adjusted vertical alignment)
-    houses_grid_content = re.sub(
-        r"<g transform='translate\(40,-8\)'>",
-        r"<g transform='translate(64,-12)'>",
-        houses_grid_content
+    houses_grid_content = houses_grid_content.replace(
+        "<g transform='translate(40,-8)'>", "<g transform='translate(64,-12)'>"
     )
     # Move degree text: x='53' → x='86' (adds padding after symbol)
-    houses_grid_content = re.sub(r"x='53'", r"x='86'", houses_grid_content)
+    houses_grid_content = houses_grid_content.replace("x='53'", "x='86'")
 
     # 8. Extract elements and qualities
     elements_content = extract_group_content(landscape_svg, 'Elements_Percentages')
     # Left-justify elements text (no text-anchor modification needed)
     # Remove x offset (positioning handled by group transform)
-    elements_content = re.sub(r" x='20'", " x='0'", elements_content)
+    elements_content = elements_content.replace(" x='20'", " x='0'")
     qualities_content = extract_group_content(landscape_svg, 'Qualities_Percentages')
     # Left-justify qualities text (no text-anchor modification needed)
     # Remove x offset (positioning handled by group transform)
-    qualities_content = re.sub(r" x='20'", " x='0'", qualities_content)
+    qualities_content = qualities_content.replace(" x='20'", " x='0'")
 
     # 9. Extract aspect grid
     aspect_grid_raw = extract_group_content(landscape_svg, 'Aspect_Grid')
     # Remove the outer translate wrapper from landscape layout
-    aspect_grid_match = re.search(
-        r"<g transform='translate\([^)]+\)'>(.*)</g>",
-        aspect_grid_raw,
-        re.DOTALL
-    )
+    aspect_grid_match = _TRANSLATE_WRAPPER_RE.search(aspect_grid_raw)
     aspect_grid_content = aspect_grid_match.group(1) if aspect_grid_match else aspect_grid_raw
 
-    # Adjust aspect grid coordinates from absolute to relative
-    # Subtract base offsets (x: 510, y: 230) to make coordinates relative to container
-    def adjust_aspect_coords(content):
-        # Store adjusted scaled coordinates with placeholders to prevent double-adjustment
-        scaled_tags = []
-
-        def store_scaled_coord(match):
-            scale = float(match.group(1))
-            x_val = float(match.group(2))
-            y_val = float(match.group(3))
-            href = match.group(4)
-
-            # The x/y coordinates are in scaled coordinate space
-            # Convert to actual position: x_actual = x_val * scale
-            # Then subtract base offset and convert back to scaled space
-            # Formula: new_x = (x_val * scale - offset) / scale
-            actual_x = x_val * scale  # Convert to actual pixels
-            actual_y = y_val * scale
-
-            adjusted_x = actual_x - 510  # Subtract landscape base offset
-            adjusted_y = actual_y - 230
-
-            new_x = adjusted_x / scale  # Convert back to scaled coordinate space
-            new_y = adjusted_y / scale
-
-            # Store the adjusted tag
-            adjusted_tag = f"<use transform='scale({scale})' x='{new_x}' y='{new_y}' xlink:href='{href}' />"
-            placeholder = f"__SCALED_PLACEHOLDER_{len(scaled_tags)}__"
-            scaled_tags.append(adjusted_tag)
-            return placeholder
-
-        # Replace scaled use tags with placeholders
-        content = re.sub(
-            r"<use transform='scale\(([\d.]+)\)'\s+x='([\d.]+)'\s+y='([\d.]+)'\s+xlink:href='([^']+)'\s*/>",
-            store_scaled_coord,
-            content
-        )
+    aspect_grid_content = _adjust_aspect_coords(aspect_grid_content)
 
-        # Now adjust regular x/y attributes (won't touch placeholders)
-        def fix_coord(match):
-            attr = match.group(1)
-            value = float(match.group(2))
-            if attr == 'x' and value >= 510:
-                new_value = value - 510
-                return f"x='{new_value:.1f}'" if '.' in match.group(2) else f"x='{int(new_value)}'"
-            elif attr == 'y' and value >= 230:
-                new_value = value - 230
-                return f"y='{new_value:.1f}'" if '.' in match.group(2) else f"y='{int(new_value)}'"
-            return match.group(0)
+    # Extract aspect list (planet headers for the aspect grid)
+    aspect_list_raw = extract_group_content(landscape_svg, 'Aspect_List')
+    # Remove the outer translate wrapper
+    aspect_list_match = _TRANSLATE_WRAPPER_RE.search(aspect_list_raw)
+    aspect_list_content = aspect_list_match.group(1) if aspect_list_match else aspect_list_raw
+    # Adjust coordinates for aspect list
+    aspect_list_content = _adjust_aspect_coords(aspect_list_content)
 
-        content = re.sub(r"(x|y)='([\d.]+)'", fix_coord, content)
+    return _LandscapeParts(
+        style=style,
+        defs=defs,
+        title_text=title_text,
+        location_content=location_content,
+        lunar_text=lunar_text,
+        moon_graphic=moon_graphic,
+        wheel_content=wheel_content,
+        planet_grid_content=planet_grid_content,
+        houses_grid_content=houses_grid_content,
+        elements_content=elements_content,
+        qualities_content=qualities_content,
+        aspect_grid_content=aspect_grid_content,
+        aspect_list_content=aspect_list_content,
+    )
 
-        # Restore scaled tags from placeholders
-        for i, adjusted_tag in enumerate(scaled_tags):
-            content = content.replace(f"__SCALED_PLACEHOLDER_{i}__", adjusted_tag)
 
-        return content
+def build_portrait_chart(landscape_svg, theme='light'):
+    """Build portrait chart with enhanced typography and wheel aesthetics.
 
-    aspect_grid_content = adjust_aspect_coords(aspect_grid_content)
+    Args:
+        theme: 'light' (white bg, for print) or 'dark' (dark bg, for screen)
 
-    # Extract aspect list (planet headers for the aspect grid)
-    aspect_list_raw = extract_group_content(landscape_svg, 'Aspect_List')
-    # Remove the outer translate wrapper
-    aspect_list_match = re.search(
-        r"<g transform='translate\([^)]+\)'>(.*)</g>",
-        aspect_list_raw,
-        re.DOTALL
+    Elements included:
+    1. Minimal header - centered (name, date/time/location, moon phase)
+    2. Wheel - centered with shadow/glow and refined styling
+    3. Planetary grid, house cusps, elements, qualities, aspects
+    """
+    parts = _extract_landscape(landscape_svg)
+
+    # Create minimal header (theme-aware: dark mode omits name, light mode includes it)
+    minimal_header = create_minimal_header(
+        parts.title_text, parts.location_content, parts.lunar_text, parts.moon_graphic, theme
     )
-    aspect_list_content = aspect_list_match.group(1) if aspect_list_match else aspect_list_raw
-    # Adjust coordinates for aspect list
-    aspect_list_content = adjust_aspect_coords(aspect_list_content)
 
     # Build portrait SVG (extended height to 2210 for separated aspect grid)
     portrait = f"""<?xml version="1.0" encoding="utf-8" standalone="no"?>
@@ -899,13 +890,13 @@ def build_portrait_chart(landscape_svg, theme='light'):
      width='800' height='2210' viewBox='0 0 800 2210'>
     <title>Natal Chart - Portrait</title>
 
-    {style}
+    {parts.style}
 
-    {defs}
+    {parts.defs}
 
     <!-- Wheel (at top, scaled 1.417x with 60px margins on each side) -->
     <g kr:node='Full_Wheel' transform='translate(60,60) scale(1.417)'>
-{wheel_content}
+{parts.wheel_content}
     </g>
 
     <!-- Minimal header (below wheel, centered) -->
@@ -915,27 +906,27 @@ def build_portrait_chart(landscape_svg, theme='light'):
 
     <!-- 6. Planetary Positions Grid (at 108,847) -->
     <g kr:node='Main_Planet_Grid' transform='translate(108,847)'>
-{planet_grid_content}    </g>
+{parts.planet_grid_content}    </g>
 
     <!-- 7. House Cusps Grid (at 285,902) -->
     <g kr:node='Main_Houses_Grid' transform='translate(285,902)'>
-{houses_grid_content}    </g>
+{parts.houses_grid_content}    </g>
 
     <!-- 8. Elements (at 490,664) -->
     <g kr:node='Elements_Percentages' transform='translate(490,664)'>
-{elements_content}    </g>
+{parts.elements_content}    </g>
 
     <!-- 9. Qualities (at 595,534) -->
     <g kr:node='Qualities_Percentages' transform='translate(595,534)'>
-{qualities_content}    </g>
+{parts.qualities_content}    </g>
 
     <!-- 10. Aspect List (planet headers for aspect grid, full width from 20px edges) -->
     <g kr:node='Aspect_List' transform='translate(20,1400) scale(3.0)'>
-{aspect_list_content}    </g>
+{parts.aspect_list_content}    </g>
 
     <!-- 11. Aspect Grid (full width from 20px edges, scaled to fit 760px) -->
     <g kr:node='Aspect_Grid' transform='translate(20,1400) scale(3.0)'>
-{aspect_grid_content}    </g>
+{parts.aspect_grid_content}    </g>
 
 </svg>"""
 
@@ -943,8 +934,7 @@ def build_portrait_chart(landscape_svg, theme='light'):
     portrait = enhance_typography(portrait)
     portrait = adjust_grid_spacing(portrait)      # Fix line spacing for larger fonts
     portrait = scale_grid_symbols(portrait)       # Scale symbols to match text size
-    portrait = enhance_wheel_aesthetics(portrait, theme=theme)
-    portrait = enhance_aspect_grid_aesthetics(portrait, theme=theme)
+    portrait = enhance_aesthetics(portrait, theme=theme)
     portrait = apply_color_theme(portrait, theme=theme)
 
     return portrait
@@ -953,7 +943,7 @@ def build_portrait_chart(landscape_svg, theme='light'):
 if __name__ == '__main__':
     # Read landscape SVG from stdin or file
     if len(sys.argv) > 1:
-        with open(sys.argv[1], 'r') as f:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
             landscape_svg = f.read()
     else:
         landscape_svg = sys.stdin.read()
@@ -976,9 +966,9 @@ if __name__ == '__main__':
         light_path = f"{output_base}-light.svg"
         dark_path = f"{output_base}-dark.svg"
 
-        with open(light_path, 'w') as f:
+        with open(light_path, 'w', encoding='utf-8') as f:
             f.write(portrait_light)
-        with open(dark_path, 'w') as f:
+        with open(dark_path, 'w', encoding='utf-8') as f:
             f.write(portrait_dark)
 
         print(f"✓ Light mode chart saved to {light_path}")
@@ -13,11 +13,15 @@ Endpoints:
 - /synthesis/* - Combined archetypal portraits
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import importlib.metadata
 
 from .routers import astrology, humandesign, synthesis, transits, composite
+from .services.astro_calculator import warm_process_pool, shutdown_process_pool
 from .utils.version import get_version
 
 __version__ = get_version()
@@ -29,12 +33,22 @@ if __version__ == "0.0.0":
     except importlib.metadata.PackageNotFoundError:
         pass
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Start the ephemeris worker processes before serving the first request
+    warm_process_pool()
+    yield
+    shutdown_process_pool()
+
 app = FastAPI(
     title="Cartographer",
     description="Unified Archetypal Mapping Engine - Astrology + Human Design",
     version=__version__,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes the large chart payloads several times faster than stdlib json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for web clients
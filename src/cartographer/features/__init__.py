@@ -3,6 +3,7 @@ from .core import (
     get_utc_offset_from_tz,
     calc_single_hd_features,
     unpack_single_features,
+    get_bodygraph,
     get_timestamp_list,
     calc_mult_hd_features,
     unpack_mult_features,
@@ -36,6 +37,7 @@ __all__ = [
     "get_utc_offset_from_tz",
     "calc_single_hd_features",
     "unpack_single_features",
+    "get_bodygraph",
     "get_timestamp_list",
     "calc_mult_hd_features",
     "unpack_mult_features",
@@ -1,4 +1,8 @@
 from .. import hd_constants
+from ..utils import serialization
+from ..utils.astrology import get_zodiac_sign
+from ..utils.date_utils import calculate_age, clean_birth_date_to_iso, clean_create_date_to_iso
+import json
 import swisseph  as swe  
 from IPython.display import display
 import pandas as pd
@@ -390,6 +394,58 @@ def unpack_single_features(single_result):
     
     return return_dict
 
+def get_bodygraph(name,year,month,day,hour,minute,lat,lng,tz_str,second=0,
+                  place=None,gender=None,islive=None):
+    '''
+    calc bodygraph chart data for one birth moment, in the
+    general/gates/channels format served by the /humandesign and
+    /synthesis endpoints (and drawn by chart_renderer.generate_bodygraph_image)
+    Args:
+        name(str): person's name
+        year,month,day,hour,minute(int): local birth time
+        lat,lng(float): birth coordinates
+        tz_str(str): birth timezone, e.g. "Europe/Berlin"
+        second(int): birth second
+        place(str): birth place label, defaults to the coordinates
+        gender(str), islive(bool): passed through to the general block
+    Return:
+        chart_data(dict): keys "name","type","general","gates","channels"
+    '''
+    birth_time = (year,month,day,hour,minute,second)
+    hours = get_utc_offset_from_tz(birth_time,tz_str)
+    timestamp = birth_time + (float(hours),)
+    single_result = calc_single_hd_features(timestamp,report=False,channel_meaning=False,day_chart_only=False)
+
+    # Personality Sun longitude is at index 0 of the 'lon' list in date_to_gate_dict
+    sun_lon = single_result[6]['lon'][0]
+
+    data = {
+        "birth_date": clean_birth_date_to_iso(single_result[9], hours),
+        "create_date": clean_create_date_to_iso(single_result[10]),
+        "birth_place": place if place is not None else "{:.4f}, {:.4f}".format(lat,lng),
+        "age": calculate_age(birth_time),
+        "zodiac_sign": get_zodiac_sign(sun_lon),
+        "gender": gender,
+        "islive": islive,
+        "energy_type": single_result[0],
+        "inner_authority": single_result[1],
+        "inc_cross": single_result[2],
+        "profile": single_result[4],
+        "active_chakras": list(single_result[7]),
+        "inactive_chakras": list(set(hd_constants.CHAKRA_LIST) - set(single_result[7])),
+        "definition": "{}".format(single_result[5]),
+        "variables": single_result[11]
+    }
+    general = json.loads(serialization.general(data))
+
+    return {
+        "name": name,
+        "type": general["energy_type"],
+        "general": general,
+        "gates": json.loads(serialization.gatesJSON(single_result[6])),
+        "channels": json.loads(serialization.channelsJSON(single_result[8], False))
+    }
+
 def get_timestamp_list(start_date,end_date,percentage,time_unit,intervall): 
     ''' 
     make list of timestamps (format: year,month,day,hour,minute) 
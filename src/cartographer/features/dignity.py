@@ -16,14 +16,27 @@ Algorithm priority order:
 4. Return neutral if no triggers
 """
 
-import json
+import functools
 import sys
 import importlib.resources
-from typing import Optional, Dict, List, Tuple
+from typing import Collection, Optional, Dict, List, Tuple
+
+import orjson
 
 # Cache for dignity data
 _dignity_data_cache: Optional[Dict] = None
 
+# Per-line planet lists, indexed as frozensets at load time
+_PLANET_SET_KEYS = ("exaltation_planets", "detriment_planets", "juxtaposition_planets")
+
+# Planet name -> bit for the bundled data, assigned while it loads and
+# read-only afterwards
+_PLANET_BITS: Dict[str, int] = {}
+
+# (gate, line) -> (no_polarity, exaltation_mask, detriment_mask, juxtaposition_mask)
+# for the bundled data, built alongside _dignity_data_cache
+_line_masks_cache: Dict[Tuple[str, str], Tuple[bool, int, int, int]] = {}
+
 # Channel definitions: (gate1, gate2) tuples
 # Source: hd_constants.py GATES_CHAKRA_DICT
 CHANNELS = [
@@ -35,6 +48,13 @@ CHANNELS = [
     (9, 52), (26, 44), (40, 37), (49, 19), (55, 39), (30, 41)
 ]
 
+# Gate -> harmonic partner gate. Gates in several channels (10, 20, 34, 57)
+# keep their first listed partner.
+_HARMONIC_GATES: Dict[int, int] = {}
+for _gate1, _gate2 in CHANNELS:
+    _HARMONIC_GATES.setdefault(_gate1, _gate2)
+    _HARMONIC_GATES.setdefault(_gate2, _gate1)
+
 
 def load_dignity_data() -> Dict:
     """
@@ -45,20 +65,67 @@ def load_dignity_data() -> Dict:
     Returns:
         Dictionary with structure: {gate: {line: {exaltation_planets, detriment_planets, ...}}}
     """
-    global _dignity_data_cache
+    global _dignity_data_cache, _PLANET_BITS, _line_masks_cache
     if _dignity_data_cache is not None:
         return _dignity_data_cache
 
     try:
         data_path = importlib.resources.files("cartographer.data").joinpath("exaltations_detriments.json")
-        with data_path.open("r", encoding="utf-8") as f:
-            _dignity_data_cache = json.load(f)
-            return _dignity_data_cache
+        data = _index_planet_sets(orjson.loads(data_path.read_bytes()))
+        # Build the lookup tables privately and publish them before the data,
+        # so concurrent first calls never see them half-filled
+        planet_bits: Dict[str, int] = {}
+        line_masks = {
+            (gate, line): _line_masks(line_data, planet_bits)
+            for gate, lines in data.items()
+            for line, line_data in lines.items()
+        }
+        _PLANET_BITS, _line_masks_cache = planet_bits, line_masks
+        _dignity_data_cache = data
+        return _dignity_data_cache
     except Exception as e:
         print(f"Error loading dignity data: {e}", file=sys.stderr)
         return {}
 
 
+def _index_planet_sets(data: Dict) -> Dict:
+    """
+    Convert each line's planet lists to frozensets of normalized names.
+
+    Names are normalized once here so the bitmasks built from them match
+    the normalized planet names calculate_dignity looks up.
+    """
+    for lines in data.values():
+        for line_data in lines.values():
+            for key in _PLANET_SET_KEYS:
+                if key in line_data:
+                    line_data[key] = frozenset(normalize_planet_name(p) for p in line_data[key])
+    return data
+
+
+def _planet_mask(planets: Collection[str], planet_bits: Dict[str, int]) -> int:
+    """OR together the bits of the given planet names, assigning new ones in planet_bits."""
+    mask = 0
+    for planet in planets:
+        mask |= planet_bits.setdefault(planet, 1 << len(planet_bits))
+    return mask
+
+
+def _line_masks(line_data: Dict, planet_bits: Dict[str, int]) -> Tuple[bool, int, int, int]:
+    """
+    Reduce a line entry to its polarity flag and planet bitmasks.
+
+    Membership then becomes an integer AND against the planet's bit in
+    planet_bits.
+    """
+    return (
+        bool(line_data.get("no_polarity", False)),
+        _planet_mask(line_data.get("exaltation_planets", ()), planet_bits),
+        _planet_mask(line_data.get("detriment_planets", ()), planet_bits),
+        _planet_mask(line_data.get("juxtaposition_planets", ()), planet_bits),
+    )
+
+
 def get_harmonic_gate(gate: int) -> Optional[int]:
     """
     Look up harmonic partner gate for a channel.
@@ -69,12 +136,7 @@ def get_harmonic_gate(gate: int) -> Optional[int]:
     Returns:
         Harmonic gate number if gate is part of a channel, None otherwise
     """
-    for gate1, gate2 in CHANNELS:
-        if gate == gate1:
-            return gate2
-        elif gate == gate2:
-            return gate1
-    return None
+    return _HARMONIC_GATES.get(gate)
 
 
 def normalize_planet_name(planet: str) -> str:
@@ -128,6 +190,44 @@ def calculate_dignity(
         - harmonic_trigger: If harmonic contributed (if applicable)
         - details: Human-readable explanation
     """
+    # With the bundled data (omitted, or the dict load_dignity_data returned)
+    # the result depends only on the arguments, so repeat gate.line/planet
+    # combinations are served from the memo
+    if dignity_data is None or dignity_data is _dignity_data_cache:
+        gate_level_key = tuple(gate_level_planets) if gate_level_planets else None
+        return dict(_calculate_dignity_cached(gate, line, active_planet, harmonic_planet, gate_level_key))
+
+    # Caller-supplied data gets its own bit table so the shared one is never
+    # written outside load_dignity_data
+    planet_bits: Dict[str, int] = {}
+    line_data = dignity_data.get(str(gate), {}).get(str(line))
+    masks = _line_masks(line_data, planet_bits) if line_data is not None else None
+
+    return _evaluate_dignity(gate, line, active_planet, harmonic_planet, masks, planet_bits, gate_level_planets)
+
+
+@functools.lru_cache(maxsize=4096)
+def _calculate_dignity_cached(
+    gate: Optional[int],
+    line: Optional[int],
+    active_planet: str,
+    harmonic_planet: Optional[str],
+    gate_level_planets: Optional[Tuple[str, ...]]
+) -> Dict[str, Optional[str]]:
+    load_dignity_data()
+    masks = _line_masks_cache.get((str(gate), str(line)))
+    return _evaluate_dignity(gate, line, active_planet, harmonic_planet, masks, _PLANET_BITS, gate_level_planets)
+
+
+def _evaluate_dignity(
+    gate: Optional[int],
+    line: Optional[int],
+    active_planet: str,
+    harmonic_planet: Optional[str],
+    masks: Optional[Tuple[bool, int, int, int]],
+    planet_bits: Dict[str, int],
+    gate_level_planets: Optional[Collection[str]]
+) -> Dict[str, Optional[str]]:
     # Handle missing or invalid gate/line
     if gate is None or line is None:
         return {
@@ -137,15 +237,8 @@ def calculate_dignity(
             "details": "Invalid gate or line"
         }
 
-    # Load dignity data if not provided
-    if dignity_data is None:
-        dignity_data = load_dignity_data()
-
     # Check if data exists for this gate.line
-    gate_str = str(gate)
-    line_str = str(line)
-
-    if gate_str not in dignity_data or line_str not in dignity_data[gate_str]:
+    if masks is None:
         return {
             "state": "neutral",
             "active_trigger": None,
@@ -153,15 +246,15 @@ def calculate_dignity(
             "details": "No dignity data for this gate.line"
         }
 
-    line_data = dignity_data[gate_str][line_str]
-
     # Normalize planet names
     active_planet = normalize_planet_name(active_planet)
     if harmonic_planet:
         harmonic_planet = normalize_planet_name(harmonic_planet)
 
+    no_polarity, exaltation_mask, detriment_mask, juxtaposition_mask = masks
+
     # Step 1: Check no_polarity flag
-    if line_data.get("no_polarity", False):
+    if no_polarity:
         return {
             "state": "neutral",
             "active_trigger": None,
@@ -169,13 +262,12 @@ def calculate_dignity(
             "details": "No polarity line"
         }
 
-    # Get planet lists
-    exaltation_planets: List[str] = line_data.get("exaltation_planets", [])
-    detriment_planets: List[str] = line_data.get("detriment_planets", [])
-    juxtaposition_planets: List[str] = line_data.get("juxtaposition_planets", [])
+    # Planets never seen in dignity data get no bit, so they match nothing
+    active_bit = planet_bits.get(active_planet, 0)
+    harmonic_bit = planet_bits.get(harmonic_planet, 0) if harmonic_planet else 0
 
     # Step 2: Check Juxtaposition - Scenario A (Star Glyph)
-    if active_planet in juxtaposition_planets:
+    if active_bit & juxtaposition_mask:
         return {
             "state": "juxtaposed",
             "active_trigger": active_planet,
@@ -183,7 +275,7 @@ def calculate_dignity(
             "details": "Star glyph (explicit juxtaposition)"
         }
 
-    if harmonic_planet and harmonic_planet in juxtaposition_planets:
+    if harmonic_bit & juxtaposition_mask:
         return {
             "state": "juxtaposed",
             "active_trigger": None,
@@ -192,10 +284,10 @@ def calculate_dignity(
         }
 
     # Check planet polarities
-    active_exalted = active_planet in exaltation_planets
-    active_detriment = active_planet in detriment_planets
-    harmonic_exalted = harmonic_planet and harmonic_planet in exaltation_planets
-    harmonic_detriment = harmonic_planet and harmonic_planet in detriment_planets
+    active_exalted = active_bit & exaltation_mask
+    active_detriment = active_bit & detriment_mask
+    harmonic_exalted = harmonic_bit & exaltation_mask
+    harmonic_detriment = harmonic_bit & detriment_mask
 
     # Step 3: Check Juxtaposition - Scenario B (Double Fixing)
     # One planet triggers exaltation, other triggers detriment
@@ -217,10 +309,11 @@ def calculate_dignity(
     if gate_level_planets:
         for planet in gate_level_planets:
             planet = normalize_planet_name(planet)
-            if planet in exaltation_planets:
+            planet_bit = planet_bits.get(planet, 0)
+            if planet_bit & exaltation_mask:
                 gate_level_exalted = True
                 gate_level_trigger = planet
-            if planet in detriment_planets:
+            if planet_bit & detriment_mask:
                 gate_level_detriment = True
                 if not gate_level_trigger:  # Prefer exaltation trigger if both exist
                     gate_level_trigger = planet
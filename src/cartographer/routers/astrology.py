@@ -13,8 +13,8 @@ from ..schemas.astrology import (
     AstrologyCalculateResponse,
     ChartFormat
 )
-from ..services.astro_calculator import calculate_natal_chart
-from ..services.astro_renderer import render_natal_chart, render_minimal_natal_chart
+from ..services.astro_calculator import calculate_natal_chart_async, run_in_process_pool
+from ..services.astro_renderer import render_natal_chart_async, render_minimal_natal_chart
 
 router = APIRouter()
 
@@ -31,7 +31,7 @@ async def calculate_astrology(request: AstrologyCalculateRequest):
     - Lunar phase and nodes
     """
     try:
-        result = calculate_natal_chart(
+        result = await calculate_natal_chart_async(
             name=request.name,
             year=request.year,
             month=request.month,
@@ -68,7 +68,7 @@ async def generate_chart(
     Returns chart image in requested format (PNG, SVG, or PDF).
     """
     try:
-        image_data, media_type = render_natal_chart(
+        image_data, media_type = await render_natal_chart_async(
             name=name,
             year=year,
             month=month,
@@ -112,7 +112,8 @@ async def generate_minimal_chart(
     Designed for use with SwiftUI native data display.
     """
     try:
-        image_data, media_type = render_minimal_natal_chart(
+        image_data, media_type = await run_in_process_pool(
+            render_minimal_natal_chart,
             name=name,
             year=year,
             month=month,
@@ -2,27 +2,51 @@
 Synthesis Router - Combined Astrology + Human Design Archetypal Portraits
 """
 
-from fastapi import APIRouter, Query, HTTPException
-from typing import Optional
+import asyncio
+import base64
 
-from ..schemas.synthesis import SynthesisRequest, SynthesisResponse
-from ..services.astro_calculator import calculate_natal_chart
+from fastapi import APIRouter, HTTPException
+from typing import List
+
+from ..schemas.synthesis import SynthesisRequest, BatchSynthesisRequest, SynthesisResponse
+from ..services.astro_calculator import calculate_natal_chart_async
+from ..services.astro_renderer import render_natal_chart_async
+from ..services.chart_renderer import generate_bodygraph_image
+from ..services.geolocation import get_latitude_longitude
 from .. import features as hd
 
 router = APIRouter()
 
-@router.post("/complete", response_model=SynthesisResponse)
-async def synthesize_complete_chart(request: SynthesisRequest):
-    """
-    Generate complete archetypal portrait combining:
-    - Western Astrology (planets, houses, aspects)
-    - Human Design (type, strategy, authority, profile, gates, channels)
 
-    Returns unified JSON with both systems' data for cross-referencing.
-    """
-    try:
-        # Calculate astrology
-        astro_data = calculate_natal_chart(
+def _calculate_bodygraph(request: SynthesisRequest):
+    """Resolve the birth location and calculate the Human Design bodygraph."""
+    # Use place for geocoding if provided, otherwise use lat/lng directly
+    if request.place:
+        coords = get_latitude_longitude(request.place)
+        lat, lng = coords[0], coords[1]
+    else:
+        lat, lng = request.lat, request.lng
+
+    return hd.get_bodygraph(
+        name=request.name,
+        year=request.year,
+        month=request.month,
+        day=request.day,
+        hour=request.hour,
+        minute=request.minute,
+        lat=lat,
+        lng=lng,
+        tz_str=request.tz_str
+    )
+
+
+async def _synthesize(request: SynthesisRequest):
+    """Calculate and combine the astrology and Human Design data for one chart."""
+    # Astrology and Human Design are independent CPU-bound calculations;
+    # run them off the event loop so the request takes max(astro, hd)
+    # rather than the sum
+    astro_data, hd_data = await asyncio.gather(
+        calculate_natal_chart_async(
             name=request.name,
             year=request.year,
             month=request.month,
@@ -33,50 +57,63 @@ async def synthesize_complete_chart(request: SynthesisRequest):
             lng=request.lng,
             tz_str=request.tz_str,
             house_system=request.house_system
-        )
+        ),
+        asyncio.to_thread(_calculate_bodygraph, request)
+    )
+
+    return {
+        "name": request.name,
+        # Same birth block calculate_natal_chart already built
+        "birth_data": astro_data["birth_data"],
+        "astrology": astro_data,
+        "human_design": hd_data,
+        "synthesis_notes": {
+            "sun_sign": astro_data["sun_sign"],
+            "hd_type": hd_data.get("type"),
+            "cross_system_resonance": "Available in future versions"
+        }
+    }
 
-        # Calculate Human Design
-        from ..services.geolocation import get_latitude_longitude
 
-        # Use place for geocoding if provided, otherwise use lat/lng directly
-        if hasattr(request, 'place') and request.place:
-            coords = get_latitude_longitude(request.place)
-            lat, lng = coords[0], coords[1]
-        else:
-            lat, lng = request.lat, request.lng
+@router.post("/complete", response_model=SynthesisResponse)
+async def synthesize_complete_chart(request: SynthesisRequest):
+    """
+    Generate complete archetypal portrait combining:
+    - Western Astrology (planets, houses, aspects)
+    - Human Design (type, strategy, authority, profile, gates, channels)
 
-        hd_data = hd.get_bodygraph(
-            name=request.name,
-            year=request.year,
-            month=request.month,
-            day=request.day,
-            hour=request.hour,
-            minute=request.minute,
-            lat=lat,
-            lng=lng,
-            tz_str=request.tz_str
-        )
+    Returns unified JSON with both systems' data for cross-referencing.
+    """
+    try:
+        return await _synthesize(request)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        return {
-            "name": request.name,
-            "birth_data": {
-                "date": f"{request.year}-{request.month:02d}-{request.day:02d}",
-                "time": f"{request.hour:02d}:{request.minute:02d}",
-                "location": {
-                    "lat": request.lat,
-                    "lng": request.lng,
-                    "timezone": request.tz_str
-                }
-            },
-            "astrology": astro_data,
-            "human_design": hd_data,
-            "synthesis_notes": {
-                "sun_sign": astro_data.get("sun", {}).get("sign"),
-                "hd_type": hd_data.get("type"),
-                "cross_system_resonance": "Available in future versions"
-            }
-        }
+@router.post("/batch", response_model=List[SynthesisResponse])
+async def synthesize_batch(request: BatchSynthesisRequest):
+    """
+    Generate complete archetypal portraits for several people in one call.
+
+    Charts are computed concurrently (at most max_concurrency at a time) on
+    the shared worker pool. Returns the portraits in request order; if any
+    chart fails, the rest of the batch is cancelled.
+    """
+    semaphore = asyncio.Semaphore(request.max_concurrency)
+
+    async def synthesize_one(item: SynthesisRequest):
+        async with semaphore:
+            return await _synthesize(item)
+
+    tasks = [asyncio.ensure_future(synthesize_one(item)) for item in request.items]
+    try:
+        return await asyncio.gather(*tasks)
     except Exception as e:
+        # gather doesn't cancel the siblings of a failed task; stop them and
+        # wait for them to unwind, so no chart is still in flight (or leaves
+        # an unretrieved exception) after the 400
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/charts")
@@ -89,56 +126,37 @@ async def generate_both_charts(request: SynthesisRequest):
     - Base64-encoded bodygraph (SVG)
     """
     try:
-        from ..services.astro_renderer import render_natal_chart
-        from ..services.hd_renderer import render_bodygraph
-        import base64
-
-        # Generate astrology chart
-        astro_chart, _ = render_natal_chart(
-            name=request.name,
-            year=request.year,
-            month=request.month,
-            day=request.day,
-            hour=request.hour,
-            minute=request.minute,
-            lat=request.lat,
-            lng=request.lng,
-            tz_str=request.tz_str,
-            output_format="png",
-            house_system=request.house_system
-        )
-
-        # Generate HD bodygraph
-        from ..services.chart_renderer import generate_chart_svg
-        from ..services.geolocation import get_latitude_longitude
-
-        if hasattr(request, 'place') and request.place:
-            coords = get_latitude_longitude(request.place)
-            lat, lng = coords[0], coords[1]
-        else:
-            lat, lng = request.lat, request.lng
-
-        hd_chart_data = hd.get_bodygraph(
-            name=request.name,
-            year=request.year,
-            month=request.month,
-            day=request.day,
-            hour=request.hour,
-            minute=request.minute,
-            lat=lat,
-            lng=lng,
-            tz_str=request.tz_str
+        def render_bodygraph_svg():
+            # Rendered straight to SVG bytes in the worker thread, so the
+            # event loop only does base64
+            return generate_bodygraph_image(_calculate_bodygraph(request), fmt='svg')
+
+        # Render the astrology chart and HD bodygraph concurrently
+        (astro_chart, _), bodygraph_svg = await asyncio.gather(
+            render_natal_chart_async(
+                name=request.name,
+                year=request.year,
+                month=request.month,
+                day=request.day,
+                hour=request.hour,
+                minute=request.minute,
+                lat=request.lat,
+                lng=request.lng,
+                tz_str=request.tz_str,
+                output_format="png",
+                house_system=request.house_system
+            ),
+            asyncio.to_thread(render_bodygraph_svg)
         )
-        bodygraph_svg = generate_chart_svg(hd_chart_data)
 
         return {
             "astrology_chart": {
                 "format": "png",
-                "data": base64.b64encode(astro_chart).decode('utf-8')
+                "data": base64.b64encode(astro_chart).decode('ascii')
             },
             "bodygraph": {
                 "format": "svg",
-                "data": base64.b64encode(bodygraph_svg.encode('utf-8')).decode('utf-8')
+                "data": base64.b64encode(bodygraph_svg).decode('ascii')
             }
         }
     except Exception as e:
@@ -3,7 +3,7 @@ Pydantic schemas for Synthesis endpoints (combined Astrology + HD)
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 class SynthesisRequest(BaseModel):
     name: str = Field(..., description="Person's name")
@@ -35,6 +35,13 @@ class SynthesisRequest(BaseModel):
             }
         }
 
+# Charts per batch request; every item queues work on the shared worker pool
+MAX_BATCH_ITEMS = 50
+
+class BatchSynthesisRequest(BaseModel):
+    items: List[SynthesisRequest] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS, description="Charts to synthesize")
+    max_concurrency: int = Field(8, ge=1, le=32, description="Charts computed at the same time")
+
 class SynthesisResponse(BaseModel):
     name: str
     birth_data: Dict[str, Any]
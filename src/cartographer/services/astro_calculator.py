@@ -4,8 +4,63 @@ Astrology Calculation Service - Kerykeion v5 wrapper
 
 from kerykeion import AstrologicalSubject
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+import copy
+from typing import Optional
+import asyncio
+import os
+import threading
 import pytz
 
+# Kerykeion/Swiss Ephemeris work is pure CPU and holds the GIL, so the API
+# runs it in worker processes to spread concurrent requests across cores.
+# The pool is created on first use and cleared on shutdown, so the app
+# lifespan can start and stop it more than once.
+_POOL_WORKERS = os.cpu_count() or 1
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Subject attributes to extract; getattr with a default replaces the
+# hasattr + getattr pair per attribute
+_TRANSIT_PLANETS = (
+    'sun', 'moon', 'mercury', 'venus', 'mars',
+    'jupiter', 'saturn', 'uranus', 'neptune', 'pluto'
+)
+_NATAL_PLANETS = _TRANSIT_PLANETS + ('mean_north_lunar_node', 'chiron')
+
+# (response key, subject attribute) for each house cusp
+_HOUSE_CUSPS = tuple(
+    (f"house_{i}", f"{word}_house")
+    for i, word in enumerate([
+        "first", "second", "third", "fourth", "fifth", "sixth",
+        "seventh", "eighth", "ninth", "tenth", "eleventh", "twelfth"
+    ], 1)
+)
+
+# Kerykeion house names ("First_House" ... "Twelfth_House") -> house number
+_HOUSE_NUM = {
+    f"{word}_House": i
+    for i, word in enumerate([
+        "First", "Second", "Third", "Fourth", "Fifth", "Sixth",
+        "Seventh", "Eighth", "Ninth", "Tenth", "Eleventh", "Twelfth"
+    ], 1)
+}
+
+# Sign abbreviation -> (element, modality), so the distribution tally is a
+# single lookup per planet
+_SIGN_CLASS = {
+    "Ari": ("Fire", "Cardinal"), "Tau": ("Earth", "Fixed"), "Gem": ("Air", "Mutable"),
+    "Can": ("Water", "Cardinal"), "Leo": ("Fire", "Fixed"), "Vir": ("Earth", "Mutable"),
+    "Lib": ("Air", "Cardinal"), "Sco": ("Water", "Fixed"), "Sag": ("Fire", "Mutable"),
+    "Cap": ("Earth", "Cardinal"), "Aqu": ("Air", "Fixed"), "Pis": ("Water", "Mutable")
+}
+
+# Decimal places kept on birth coordinates; matches the geocoder's
+# resolution (~11 m), so finer digits only fragment the cache
+COORD_PRECISION = 4
+
 def calculate_natal_chart(
     name: str,
     year: int,
@@ -21,8 +76,31 @@ def calculate_natal_chart(
     """
     Calculate complete natal chart using Kerykeion v5.
 
+    Charts are deterministic in their inputs, so results are cached by the
+    normalized birth key. Each call gets its own copy, so callers may
+    modify it without affecting the cache.
+
     Returns dictionary with planets, houses, aspects, etc.
     """
+    return copy.deepcopy(_calculate_natal_chart(
+        name, year, month, day, hour, minute,
+        round(lat, COORD_PRECISION), round(lng, COORD_PRECISION),
+        tz_str, house_system
+    ))
+
+@lru_cache(maxsize=4096)
+def _calculate_natal_chart(
+    name: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    lat: float,
+    lng: float,
+    tz_str: str,
+    house_system: str
+):
     # Create AstrologicalSubject
     subject = AstrologicalSubject(
         name=name,
@@ -36,42 +114,30 @@ def calculate_natal_chart(
         tz_str=tz_str
     )
 
-    # List of planets to extract
-    planet_names = [
-        'sun', 'moon', 'mercury', 'venus', 'mars',
-        'jupiter', 'saturn', 'uranus', 'neptune', 'pluto',
-        'mean_north_lunar_node', 'chiron'
-    ]
-
     # Extract planet data
     planets_data = []
-    for planet_name in planet_names:
-        if hasattr(subject, planet_name):
-            planet = getattr(subject, planet_name)
-            if planet:  # Some might be None
-                planets_data.append({
-                    "name": planet.name,
-                    "sign": planet.sign,
-                    "longitude": planet.abs_pos,  # Absolute position 0-360
-                    "latitude": 0.0,  # v5 doesn't expose latitude easily
-                    "speed": getattr(planet, 'speed', 0.0),
-                    "retrograde": planet.retrograde,
-                    "house": int(planet.house.replace('_House', '').replace('First', '1').replace('Second', '2').replace('Third', '3').replace('Fourth', '4').replace('Fifth', '5').replace('Sixth', '6').replace('Seventh', '7').replace('Eighth', '8').replace('Ninth', '9').replace('Tenth', '10').replace('Eleventh', '11').replace('Twelfth', '12')) if planet.house else 0
-                })
+    sun_sign = None
+    for planet_name in _NATAL_PLANETS:
+        planet = getattr(subject, planet_name, None)
+        if planet:  # Some might be missing or None
+            if planet_name == 'sun':
+                sun_sign = planet.sign
+            planets_data.append({
+                "name": planet.name,
+                "sign": planet.sign,
+                "longitude": planet.abs_pos,  # Absolute position 0-360
+                "latitude": 0.0,  # v5 doesn't expose latitude easily
+                "speed": getattr(planet, 'speed', 0.0),
+                "retrograde": planet.retrograde,
+                "house": _HOUSE_NUM.get(planet.house, 0) if planet.house else 0
+            })
 
     # Extract house cusps
     houses_data = {}
-    house_names = [
-        'first_house', 'second_house', 'third_house', 'fourth_house',
-        'fifth_house', 'sixth_house', 'seventh_house', 'eighth_house',
-        'ninth_house', 'tenth_house', 'eleventh_house', 'twelfth_house'
-    ]
-
-    for i, house_name in enumerate(house_names, 1):
-        if hasattr(subject, house_name):
-            house = getattr(subject, house_name)
-            if house:
-                houses_data[f"house_{i}"] = house.abs_pos
+    for house_key, house_name in _HOUSE_CUSPS:
+        house = getattr(subject, house_name, None)
+        if house:
+            houses_data[house_key] = house.abs_pos
 
     # Extract aspects (if available)
     aspects_data = []
@@ -89,25 +155,12 @@ def calculate_natal_chart(
     elements = {"Fire": 0, "Earth": 0, "Air": 0, "Water": 0}
     modalities = {"Cardinal": 0, "Fixed": 0, "Mutable": 0}
 
-    element_map = {
-        "Ari": "Fire", "Leo": "Fire", "Sag": "Fire",
-        "Tau": "Earth", "Vir": "Earth", "Cap": "Earth",
-        "Gem": "Air", "Lib": "Air", "Aqu": "Air",
-        "Can": "Water", "Sco": "Water", "Pis": "Water"
-    }
-
-    modality_map = {
-        "Ari": "Cardinal", "Can": "Cardinal", "Lib": "Cardinal", "Cap": "Cardinal",
-        "Tau": "Fixed", "Leo": "Fixed", "Sco": "Fixed", "Aqu": "Fixed",
-        "Gem": "Mutable", "Vir": "Mutable", "Sag": "Mutable", "Pis": "Mutable"
-    }
-
     for planet in planets_data:
-        sign = planet["sign"]
-        if sign in element_map:
-            elements[element_map[sign]] += 1
-        if sign in modality_map:
-            modalities[modality_map[sign]] += 1
+        sign_class = _SIGN_CLASS.get(planet["sign"])
+        if sign_class:
+            element, modality = sign_class
+            elements[element] += 1
+            modalities[modality] += 1
 
     # Lunar phase
     lunar_phase_data = {
@@ -128,6 +181,7 @@ def calculate_natal_chart(
             "location": {"lat": lat, "lng": lng, "timezone": tz_str}
         },
         "planets": planets_data,
+        "sun_sign": sun_sign,
         "houses": houses_data,
         "aspects": aspects_data,
         "lunar_phase": lunar_phase_data,
@@ -138,38 +192,98 @@ def calculate_natal_chart(
 def calculate_current_transits(lat: float, lng: float, tz_str: str):
     """Calculate current planetary positions (transits)."""
     now = datetime.now(pytz.timezone(tz_str))
+    utc_minute = now.astimezone(pytz.utc).replace(second=0, microsecond=0)
 
+    return {
+        "timestamp": now.isoformat(),
+        "location": {"lat": lat, "lng": lng, "timezone": tz_str},
+        # Fresh dicts per response; the cached positions stay untouched
+        "transits": [
+            {"planet": planet, "sign": sign, "longitude": longitude, "retrograde": retrograde}
+            for planet, sign, longitude, retrograde in _transit_positions(utc_minute)
+        ]
+    }
+
+@lru_cache(maxsize=2)
+def _transit_positions(utc_minute: datetime):
+    # Geocentric positions depend only on the moment, which transits resolve
+    # to the minute, so one calculation per minute serves every observer.
+    # The cache holds the current and previous minute as immutable tuples of
+    # (planet, sign, longitude, retrograde).
     subject = AstrologicalSubject(
         name="Current Transits",
-        year=now.year,
-        month=now.month,
-        day=now.day,
-        hour=now.hour,
-        minute=now.minute,
-        lat=lat,
-        lng=lng,
-        tz_str=tz_str
+        year=utc_minute.year,
+        month=utc_minute.month,
+        day=utc_minute.day,
+        hour=utc_minute.hour,
+        minute=utc_minute.minute,
+        lat=0.0,
+        lng=0.0,
+        tz_str="UTC"
     )
 
-    planet_names = [
-        'sun', 'moon', 'mercury', 'venus', 'mars',
-        'jupiter', 'saturn', 'uranus', 'neptune', 'pluto'
-    ]
-
     transits = []
-    for planet_name in planet_names:
-        if hasattr(subject, planet_name):
-            planet = getattr(subject, planet_name)
-            if planet:
-                transits.append({
-                    "planet": planet.name,
-                    "sign": planet.sign,
-                    "longitude": planet.abs_pos,
-                    "retrograde": planet.retrograde
-                })
+    for planet_name in _TRANSIT_PLANETS:
+        planet = getattr(subject, planet_name, None)
+        if planet:
+            transits.append((planet.name, planet.sign, planet.abs_pos, planet.retrograde))
+    return tuple(transits)
 
-    return {
-        "timestamp": now.isoformat(),
-        "location": {"lat": lat, "lng": lng, "timezone": tz_str},
-        "transits": transits
-    }
+def _noop():
+    pass
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the worker pool, creating it if it isn't running."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=_POOL_WORKERS)
+        return _pool
+
+def warm_process_pool():
+    """Start every worker process so the first requests don't pay the spawn cost."""
+    pool = _get_pool()
+    for future in [pool.submit(_noop) for _ in range(_POOL_WORKERS)]:
+        future.result()
+
+def shutdown_process_pool():
+    """Stop the worker processes; the next call starts a fresh pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+async def run_in_process_pool(func, *args, **kwargs):
+    """
+    Run a picklable CPU-bound call in the worker pool without blocking the event loop.
+
+    Each worker process has its own copy of the module-level lru_caches, so
+    a repeat call is only a cache hit when it lands on a worker that already
+    served it. Worker caches are lost when the pool shuts down.
+
+    If a worker died (OOM, a crash in swisseph or cairosvg) the pool is
+    broken for good; it is replaced and the call retried once.
+    """
+    global _pool
+    loop = asyncio.get_running_loop()
+    call = partial(func, *args, **kwargs)
+    pool = _get_pool()
+    try:
+        return await loop.run_in_executor(pool, call)
+    except BrokenProcessPool:
+        with _pool_lock:
+            # Another request may already have replaced it
+            if _pool is pool:
+                _pool = None
+        pool.shutdown(wait=False)
+        return await loop.run_in_executor(_get_pool(), call)
+
+async def calculate_natal_chart_async(**kwargs):
+    """
+    calculate_natal_chart in a worker process.
+
+    The natal chart cache lives in each worker (see run_in_process_pool),
+    so repeat requests only hit when they reach the same worker.
+    """
+    return await run_in_process_pool(calculate_natal_chart, **kwargs)
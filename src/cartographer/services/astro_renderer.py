@@ -3,9 +3,15 @@ Astrology Chart Rendering Service - Kerykeion chart generation
 """
 
 from kerykeion import AstrologicalSubject, KerykeionChartSVG
+from functools import lru_cache
 import io
 import re
 
+from .astro_calculator import COORD_PRECISION, run_in_process_pool
+
+
+_STYLE_OPEN_RE = re.compile(r'(<style[^>]*>)')
+
 
 def _inject_font_family(svg_content: str) -> str:
     """Inject SF Pro font-family and spacing fixes into Kerykeion SVG output.
@@ -23,8 +29,7 @@ def _inject_font_family(svg_content: str) -> str:
     )
     # Insert after opening <style> tag
     if "<style" in svg_content:
-        svg_content = re.sub(
-            r'(<style[^>]*>)',
+        svg_content = _STYLE_OPEN_RE.sub(
             r'\1\n        ' + font_rule + '        ',
             svg_content,
             count=1
@@ -38,6 +43,8 @@ def _inject_font_family(svg_content: str) -> str:
         )
     return svg_content
 
+_CUSP_LABEL_RE = re.compile(r"<text text-anchor='end' x='40'([^>]*)>Cusp\s*(?:&#160;)*(\d+):")
+
 def _fix_cusp_alignment(svg_content: str) -> str:
     """Fix cusp label alignment to be left-justified.
 
@@ -47,13 +54,16 @@ def _fix_cusp_alignment(svg_content: str) -> str:
     # Remove non-breaking spaces before cusp numbers and change to left alignment
     # Pattern: <text text-anchor='end' x='40' ...>Cusp &#160;&#160;1:</text>
     # Replace with: <text x='0' ...>Cusp 1:</text>
-    svg_content = re.sub(
-        r"<text text-anchor='end' x='40'([^>]*)>Cusp\s*(?:&#160;)*(\d+):",
-        r"<text x='0'\1>Cusp \2:",
-        svg_content
-    )
+    svg_content = _CUSP_LABEL_RE.sub(r"<text x='0'\1>Cusp \2:", svg_content)
     return svg_content
 
+_GRID_SIGN_RE = re.compile(
+    r"<g transform='translate\(60,-8\)'><use transform='scale\(0\.3\)' xlink:href='#(Ari|Tau|Gem|Can|Leo|Vir|Lib|Sco|Sag|Cap|Aqu|Pis)' /></g>"
+)
+_GRID_RETROGRADE_RE = re.compile(
+    r"<g transform='translate\(74,-6\)'><use transform='scale\(\.5\)' xlink:href='#retrograde' /></g>"
+)
+
 def _adjust_planet_grid_spacing(svg_content: str) -> str:
     """Increase spacing between planet positions and zodiac sign symbols.
 
@@ -61,65 +71,59 @@ def _adjust_planet_grid_spacing(svg_content: str) -> str:
     with degree/minute/second text in the planetary positions grid.
     """
     # Move zodiac sign symbols from translate(60,-8) to translate(75,-8)
-    svg_content = re.sub(
-        r"<g transform='translate\(60,-8\)'><use transform='scale\(0\.3\)' xlink:href='#(Ari|Tau|Gem|Can|Leo|Vir|Lib|Sco|Sag|Cap|Aqu|Pis)' /></g>",
+    svg_content = _GRID_SIGN_RE.sub(
         r"<g transform='translate(75,-8)'><use transform='scale(0.3)' xlink:href='#\1' /></g>",
         svg_content
     )
 
     # Move retrograde symbols from translate(74,-6) to translate(89,-6)
-    svg_content = re.sub(
-        r"<g transform='translate\(74,-6\)'><use transform='scale\(\.5\)' xlink:href='#retrograde' /></g>",
+    svg_content = _GRID_RETROGRADE_RE.sub(
         r"<g transform='translate(89,-6)'><use transform='scale(.5)' xlink:href='#retrograde' /></g>",
         svg_content
     )
 
     return svg_content
 
+# Location: label and the city name on the line below it
+_LOCATION_LINES_RE = re.compile(
+    r"(<text kr:node='Top_Left_Text_0'[^>]*y='58'[^>]*>Location:</text>)\s*"
+    r"<text kr:node='Top_Left_Text_1'[^>]*y='70'[^>]*>([^<]+)</text>"
+)
+# Top_Left_Text_N -> (current y, shifted y); each line moves up one row
+_TOP_LEFT_TEXT_Y_SHIFTS = {
+    '2': ('82', '70'),
+    '3': ('94', '82'),
+    '4': ('106', '94'),
+    '5': ('118', '106'),
+}
+_TOP_LEFT_TEXT_Y_RE = re.compile(r"(<text kr:node='Top_Left_Text_([2-5])'[^>]*)y='(82|94|106|118)'")
+
+
+def _shift_top_left_text_y(m: re.Match) -> str:
+    current, shifted = _TOP_LEFT_TEXT_Y_SHIFTS[m[2]]
+    if m[3] != current:
+        return m[0]
+    return f"{m[1]}y='{shifted}'"
+
+
 def _combine_location_line(svg_content: str) -> str:
     """Combine 'Location:' label and city name onto a single line.
 
     Kerykeion generates these as separate text elements on different lines.
     This merges them and adjusts subsequent line positions.
     """
-    # Find Location: and city text elements
-    location_pattern = (
-        r"(<text kr:node='Top_Left_Text_0'[^>]*y='58'[^>]*>Location:</text>)\s*"
-        r"<text kr:node='Top_Left_Text_1'[^>]*y='70'[^>]*>([^<]+)</text>"
-    )
-
-    # Replace with combined single-line text
-    svg_content = re.sub(
-        location_pattern,
+    # Replace Location: and city text elements with combined single-line text
+    # Each Top_Left_Text_N node occurs once, near the top of the document, so
+    # every pass stops at its first match instead of scanning to the end
+    svg_content = _LOCATION_LINES_RE.sub(
         r"<text kr:node='Top_Left_Text_0' x='20' y='58' style='fill: var(--kerykeion-chart-color-paper-0); font-size: 10px'>Location: \2</text>",
-        svg_content
+        svg_content,
+        count=1
     )
 
     # Shift subsequent text elements up by 12 pixels (the removed line spacing)
-    # Top_Left_Text_2: y='82' -> y='70'
-    svg_content = re.sub(
-        r"(<text kr:node='Top_Left_Text_2'[^>]*)y='82'",
-        r"\1y='70'",
-        svg_content
-    )
-    # Top_Left_Text_3: y='94' -> y='82'
-    svg_content = re.sub(
-        r"(<text kr:node='Top_Left_Text_3'[^>]*)y='94'",
-        r"\1y='82'",
-        svg_content
-    )
-    # Top_Left_Text_4: y='106' -> y='94'
-    svg_content = re.sub(
-        r"(<text kr:node='Top_Left_Text_4'[^>]*)y='106'",
-        r"\1y='94'",
-        svg_content
-    )
-    # Top_Left_Text_5: y='118' -> y='106'
-    svg_content = re.sub(
-        r"(<text kr:node='Top_Left_Text_5'[^>]*)y='118'",
-        r"\1y='106'",
-        svg_content
-    )
+    # Top_Left_Text_2..5: y='82'/'94'/'106'/'118' -> y='70'/'82'/'94'/'106'
+    svg_content = _TOP_LEFT_TEXT_Y_RE.sub(_shift_top_left_text_y, svg_content, count=4)
 
     return svg_content
 
@@ -131,67 +135,66 @@ def _fix_viewbox_clipping(svg_content: str) -> str:
     Expand to give more breathing room.
     """
     # Expand viewBox: add padding on all sides
-    svg_content = re.sub(
-        r"viewBox='0 -15 890 580'",
-        r"viewBox='-30 -45 950 650'",
-        svg_content
+    # Plain literal, so str.replace's fast search beats the regex engine
+    svg_content = svg_content.replace(
+        "viewBox='0 -15 890 580'",
+        "viewBox='-30 -45 950 650'"
     )
 
     return svg_content
 
 
+# More vibrant zodiac colors (Fire=red/orange, Earth=green/brown, Air=blue/purple, Water=blue/teal)
+_ZODIAC_COLORS = {
+    # Fire signs (Aries, Leo, Sag) - vibrant reds/oranges
+    '--kerykeion-chart-color-zodiac-bg-0': '#ff4500',  # Aries - red-orange
+    '--kerykeion-chart-color-zodiac-bg-4': '#ff6b35',  # Leo - coral
+    '--kerykeion-chart-color-zodiac-bg-8': '#ff8c42',  # Sag - light orange
+
+    # Earth signs (Taurus, Virgo, Cap) - greens/browns
+    '--kerykeion-chart-color-zodiac-bg-1': '#6b8e23',  # Taurus - olive green
+    '--kerykeion-chart-color-zodiac-bg-5': '#8b7355',  # Virgo - earth brown
+    '--kerykeion-chart-color-zodiac-bg-9': '#556b2f',  # Cap - dark olive
+
+    # Air signs (Gemini, Libra, Aquarius) - blues/purples
+    '--kerykeion-chart-color-zodiac-bg-2': '#4682b4',  # Gemini - steel blue
+    '--kerykeion-chart-color-zodiac-bg-6': '#6a5acd',  # Libra - slate blue
+    '--kerykeion-chart-color-zodiac-bg-10': '#5f9ea0', # Aquarius - cadet blue
+
+    # Water signs (Cancer, Scorpio, Pisces) - deep blues/teals
+    '--kerykeion-chart-color-zodiac-bg-3': '#20b2aa',  # Cancer - light sea green
+    '--kerykeion-chart-color-zodiac-bg-7': '#483d8b',  # Scorpio - dark slate blue
+    '--kerykeion-chart-color-zodiac-bg-11': '#4169e1', # Pisces - royal blue
+}
+
+# Make aspect colors more vibrant and visible
+_ASPECT_COLORS = {
+    '--kerykeion-chart-color-conjunction': '#5555ff',  # Bright blue
+    '--kerykeion-chart-color-sextile': '#ffa500',      # Orange
+    '--kerykeion-chart-color-square': '#ff0000',       # Pure red
+    '--kerykeion-chart-color-trine': '#00ff00',        # Bright green
+    '--kerykeion-chart-color-opposition': '#9932cc',   # Dark orchid
+}
+
+# All color overrides in one alternation, so the SVG is scanned once rather
+# than once per variable
+_COLOR_MAP = {**_ZODIAC_COLORS, **_ASPECT_COLORS}
+_COLOR_RE = re.compile(r'(' + '|'.join(map(re.escape, _COLOR_MAP)) + r'): #[0-9a-fA-F]{6};')
+
+
 def _enhance_colors(svg_content: str) -> str:
     """Enhance color palette for better visual identity.
 
     Makes zodiac wheel more vibrant and aspects more visible.
     """
-    # More vibrant zodiac colors (Fire=red/orange, Earth=green/brown, Air=blue/purple, Water=blue/teal)
-    color_replacements = {
-        # Fire signs (Aries, Leo, Sag) - vibrant reds/oranges
-        '--kerykeion-chart-color-zodiac-bg-0': '#ff4500',  # Aries - red-orange
-        '--kerykeion-chart-color-zodiac-bg-4': '#ff6b35',  # Leo - coral
-        '--kerykeion-chart-color-zodiac-bg-8': '#ff8c42',  # Sag - light orange
-
-        # Earth signs (Taurus, Virgo, Cap) - greens/browns
-        '--kerykeion-chart-color-zodiac-bg-1': '#6b8e23',  # Taurus - olive green
-        '--kerykeion-chart-color-zodiac-bg-5': '#8b7355',  # Virgo - earth brown
-        '--kerykeion-chart-color-zodiac-bg-9': '#556b2f',  # Cap - dark olive
-
-        # Air signs (Gemini, Libra, Aquarius) - blues/purples
-        '--kerykeion-chart-color-zodiac-bg-2': '#4682b4',  # Gemini - steel blue
-        '--kerykeion-chart-color-zodiac-bg-6': '#6a5acd',  # Libra - slate blue
-        '--kerykeion-chart-color-zodiac-bg-10': '#5f9ea0', # Aquarius - cadet blue
-
-        # Water signs (Cancer, Scorpio, Pisces) - deep blues/teals
-        '--kerykeion-chart-color-zodiac-bg-3': '#20b2aa',  # Cancer - light sea green
-        '--kerykeion-chart-color-zodiac-bg-7': '#483d8b',  # Scorpio - dark slate blue
-        '--kerykeion-chart-color-zodiac-bg-11': '#4169e1', # Pisces - royal blue
-    }
-
-    for var_name, color in color_replacements.items():
-        svg_content = re.sub(
-            rf'{var_name}: #[0-9a-fA-F]{{6}};',
-            f'{var_name}: {color};',
-            svg_content
-        )
+    return _COLOR_RE.sub(lambda m: f"{m[1]}: {_COLOR_MAP[m[1]]};", svg_content)
 
-    # Make aspect colors more vibrant and visible
-    aspect_color_replacements = {
-        '--kerykeion-chart-color-conjunction': '#5555ff',  # Bright blue
-        '--kerykeion-chart-color-sextile': '#ffa500',      # Orange
-        '--kerykeion-chart-color-square': '#ff0000',       # Pure red
-        '--kerykeion-chart-color-trine': '#00ff00',        # Bright green
-        '--kerykeion-chart-color-opposition': '#9932cc',   # Dark orchid
-    }
-
-    for var_name, color in aspect_color_replacements.items():
-        svg_content = re.sub(
-            rf'{var_name}: #[0-9a-fA-F]{{6}};',
-            f'{var_name}: {color};',
-            svg_content
-        )
 
-    return svg_content
+_CHART_TITLE_SIZE_RE = re.compile(r"(kr:node='Chart_Title'[^>]*style='[^']*font-size:)\s*24px")
+# scale(0.4) inside a planet <use> tag, after its href
+_PLANET_SCALE_RE = re.compile(
+    r"(xlink:href='#(?:Sun|Moon|Mercury|Venus|Mars|Jupiter|Saturn|Uranus|Neptune|Pluto)'[^/>]*?)scale\(0\.4\)"
+)
 
 
 def _improve_typography(svg_content: str) -> str:
@@ -200,22 +203,30 @@ def _improve_typography(svg_content: str) -> str:
     Better font sizes, weights, and spacing for improved readability.
     """
     # Increase title font size for better hierarchy
-    svg_content = re.sub(
-        r"(kr:node='Chart_Title'[^>]*style='[^']*font-size:)\s*24px",
+    svg_content = _CHART_TITLE_SIZE_RE.sub(
         r"\1 28px; font-weight: 600",
-        svg_content
+        svg_content,
+        count=1  # single title node; stop scanning once it's found
     )
 
     # Make planet symbols slightly larger
-    svg_content = re.sub(
-        r"(xlink:href='#(Sun|Moon|Mercury|Venus|Mars|Jupiter|Saturn|Uranus|Neptune|Pluto)'[^/]*/?>)",
-        lambda m: m.group(1).replace("scale(0.4)", "scale(0.45)") if "scale(0.4)" in m.group(1) else m.group(1),
-        svg_content
-    )
+    svg_content = _PLANET_SCALE_RE.sub(r"\1scale(0.45)", svg_content)
 
     return svg_content
 
 
+_PORTRAIT_STYLE_RE = re.compile(r'(<style[^>]*>.*?</style>)', re.DOTALL)
+_PORTRAIT_DEFS_RE = re.compile(r'(<defs[^>]*>.*?</defs>)', re.DOTALL)
+_PORTRAIT_TITLE_RE = re.compile(r"<text[^>]*kr:node='Chart_Title'[^>]*>([^<]+)</text>")
+_PORTRAIT_ZODIAC_RE = re.compile(r"<g kr:node='Bottom_Left_Text'[^>]*>(.*?)</g>", re.DOTALL)
+_PORTRAIT_LOCATION_RE = re.compile(r"<g kr:node='Top_Left_Text'[^>]*>(.*?)</g>", re.DOTALL)
+_PORTRAIT_MOON_RE = re.compile(r"<g kr:node='Lunar_Phase'[^>]*>(.*?)</g>", re.DOTALL)
+_PORTRAIT_WHEEL_RE = re.compile(
+    r"<g kr:node='Full_Wheel'[^>]*>(.*?)</g>\s*<g kr:node='Houses_And_Planets_Grid'",
+    re.DOTALL
+)
+
+
 def _build_portrait_chart(svg_content: str) -> str:
     """Build portrait chart with only essential elements using regex extraction.
 
@@ -227,47 +238,31 @@ def _build_portrait_chart(svg_content: str) -> str:
     5. Wheel (centered at 70,140)
     """
     # Extract style section
-    style_match = re.search(r'(<style[^>]*>.*?</style>)', svg_content, re.DOTALL)
+    style_match = _PORTRAIT_STYLE_RE.search(svg_content)
     style_section = style_match.group(1) if style_match else ''
 
     # Extract defs section (contains planet/zodiac symbols)
-    defs_match = re.search(r'(<defs[^>]*>.*?</defs>)', svg_content, re.DOTALL)
+    defs_match = _PORTRAIT_DEFS_RE.search(svg_content)
     defs_section = defs_match.group(1) if defs_match else ''
 
     # 1. Extract title text
-    title_match = re.search(r"<text[^>]*kr:node='Chart_Title'[^>]*>([^<]+)</text>", svg_content)
+    title_match = _PORTRAIT_TITLE_RE.search(svg_content)
     title_text = title_match.group(1) if title_match else 'Birth Chart'
 
     # 2. Extract zodiacal information group (Bottom_Left_Text)
-    zodiac_match = re.search(
-        r"<g kr:node='Bottom_Left_Text'[^>]*>(.*?)</g>",
-        svg_content,
-        re.DOTALL
-    )
+    zodiac_match = _PORTRAIT_ZODIAC_RE.search(svg_content)
     zodiac_content = zodiac_match.group(1) if zodiac_match else ''
 
     # 3. Extract location metadata group (Top_Left_Text)
-    location_match = re.search(
-        r"<g kr:node='Top_Left_Text'[^>]*>(.*?)</g>",
-        svg_content,
-        re.DOTALL
-    )
+    location_match = _PORTRAIT_LOCATION_RE.search(svg_content)
     location_content = location_match.group(1) if location_match else ''
 
     # 4. Extract moon phase graphic (Lunar_Phase)
-    moon_match = re.search(
-        r"<g kr:node='Lunar_Phase'[^>]*>(.*?)</g>",
-        svg_content,
-        re.DOTALL
-    )
+    moon_match = _PORTRAIT_MOON_RE.search(svg_content)
     moon_content = moon_match.group(1) if moon_match else ''
 
     # 5. Extract wheel (Full_Wheel) - this is complex, need to get all nested content
-    wheel_match = re.search(
-        r"<g kr:node='Full_Wheel'[^>]*>(.*?)</g>\s*<g kr:node='Houses_And_Planets_Grid'",
-        svg_content,
-        re.DOTALL
-    )
+    wheel_match = _PORTRAIT_WHEEL_RE.search(svg_content)
     wheel_content = wheel_match.group(1) if wheel_match else ''
 
     # Build new portrait SVG
@@ -303,60 +298,86 @@ def _build_portrait_chart(svg_content: str) -> str:
 
     return portrait_svg
 
-def render_natal_chart(
-    name: str,
-    year: int,
-    month: int,
-    day: int,
-    hour: int,
-    minute: int,
-    lat: float,
-    lng: float,
-    tz_str: str,
-    output_format: str = "png",
-    house_system: str = "P",
-    city: str = None
-):
+@lru_cache(maxsize=10_000)
+def _resolve_city_nation(lat: float, lng: float):
     """
-    Render natal chart visualization using Kerykeion.
+    Reverse geocode coordinates to a display city and nation code.
 
-    Args:
-        output_format: "png", "svg", or "pdf"
-        city: Optional city name (will attempt reverse geocode if not provided)
+    Cached because Nominatim is a slow network round trip limited to one
+    request per second. Lookup errors propagate (and so aren't cached).
 
     Returns:
-        Tuple of (image_bytes, media_type)
+        Tuple of (city or None, nation)
+    """
+    from geopy.geocoders import Nominatim
+    geolocator = Nominatim(user_agent="cartographer")
+    location = geolocator.reverse(f"{lat}, {lng}", language='en')
+    if not location:
+        return None, "US"
+
+    # Extract location components
+    address = location.raw.get('address', {})
+    city_name = address.get('city') or address.get('town') or address.get('village')
+    state_code = address.get('ISO3166-2-lvl4', '').split('-')[-1] if 'ISO3166-2-lvl4' in address else address.get('state')
+    country_code = address.get('country_code', '').upper()
+
+    # Set nation from geocoding
+    nation = country_code if country_code else "US"
+
+    # Build location string (City, State for US; City, Country otherwise)
+    if country_code == 'US' and city_name and state_code:
+        return f"{city_name}, {state_code}", nation
+    elif city_name:
+        country = address.get('country', '')
+        return (f"{city_name}, {country}" if country else city_name), nation
+    return None, nation
+
+
+# Rendered charts kept per worker process. Entries hold full PNG/PDF/SVG
+# bytes (a few hundred KB each), and every pool worker has its own cache,
+# so the total is about 32 x ~0.5 MB = ~16 MB per worker, times
+# os.cpu_count() workers.
+_RENDER_CACHE_SIZE = 32
+
+
+def _birth_place(lat: float, lng: float, city: str):
+    """
+    Work out the city label and nation to print on a chart.
+
+    Returns:
+        Tuple of (city, nation, cacheable). cacheable is False when the
+        reverse geocode failed, so the coordinate fallback label isn't
+        kept in a render cache and the next request retries the lookup.
     """
     # Get city name and nation if not provided
     nation = "US"  # Default to US
+    cacheable = True
     if not city:
         try:
-            from geopy.geocoders import Nominatim
-            geolocator = Nominatim(user_agent="cartographer")
-            location = geolocator.reverse(f"{lat}, {lng}", language='en')
-            if location:
-                # Extract location components
-                address = location.raw.get('address', {})
-                city_name = address.get('city') or address.get('town') or address.get('village')
-                state_code = address.get('ISO3166-2-lvl4', '').split('-')[-1] if 'ISO3166-2-lvl4' in address else address.get('state')
-                country_code = address.get('country_code', '').upper()
-
-                # Set nation from geocoding
-                nation = country_code if country_code else "US"
-
-                # Build location string (City, State for US; City, Country otherwise)
-                if country_code == 'US' and city_name and state_code:
-                    city = f"{city_name}, {state_code}"
-                elif city_name:
-                    country = address.get('country', '')
-                    city = f"{city_name}, {country}" if country else city_name
-                else:
-                    city = f"{lat:.4f}, {lng:.4f}"
-            else:
-                city = f"{lat:.4f}, {lng:.4f}"
+            # ~100 m resolution is plenty for naming the city
+            city, nation = _resolve_city_nation(round(lat, 3), round(lng, 3))
         except:
+            city = None
+            cacheable = False
+        if not city:
             city = f"{lat:.4f}, {lng:.4f}"
+    return city, nation, cacheable
+
 
+def _kerykeion_svg(
+    name: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    lat: float,
+    lng: float,
+    tz_str: str,
+    city: str,
+    nation: str
+) -> str:
+    """Generate Kerykeion's natal chart SVG, before any post-processing."""
     # Create AstrologicalSubject
     subject = AstrologicalSubject(
         name=name,
@@ -374,7 +395,64 @@ def render_natal_chart(
 
     # Generate SVG chart
     chart = KerykeionChartSVG(subject, chart_type="Natal")
-    svg_content = chart.makeTemplate()
+    return chart.makeTemplate()
+
+
+def render_natal_chart(
+    name: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    lat: float,
+    lng: float,
+    tz_str: str,
+    output_format: str = "png",
+    house_system: str = "P",
+    city: str = None
+):
+    """
+    Render natal chart visualization using Kerykeion.
+
+    Rendered charts are cached by the normalized birth key plus output
+    format, house system and resolved city. Renders whose reverse geocode
+    failed are not cached. Each worker process keeps up to 32 renders
+    (~16 MB), so the total is ~16 MB x os.cpu_count().
+
+    Args:
+        output_format: "png", "svg", or "pdf"
+        city: Optional city name (will attempt reverse geocode if not provided)
+
+    Returns:
+        Tuple of (image_bytes, media_type)
+    """
+    lat, lng = round(lat, COORD_PRECISION), round(lng, COORD_PRECISION)
+    city, nation, cacheable = _birth_place(lat, lng, city)
+    render = _render_natal_chart if cacheable else _render_natal_chart.__wrapped__
+    return render(
+        name, year, month, day, hour, minute, lat, lng,
+        tz_str, output_format, house_system, city, nation
+    )
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _render_natal_chart(
+    name: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    lat: float,
+    lng: float,
+    tz_str: str,
+    output_format: str,
+    house_system: str,
+    city: str,
+    nation: str
+):
+    svg_content = _kerykeion_svg(name, year, month, day, hour, minute, lat, lng, tz_str, city, nation)
 
     # Apply visual enhancements (landscape format)
     svg_content = _fix_viewbox_clipping(svg_content)      # Fix degree marker clipping
@@ -414,6 +492,10 @@ def render_natal_chart(
         return svg_content.encode('utf-8'), "image/svg+xml"
 
 
+# A whole <text> element, self-closing or with its content (incl. <tspan>s)
+_TEXT_ELEMENT_RE = re.compile(r'<text\b(?:[^>]*/>|[^>]*>.*?</text>)', re.DOTALL)
+
+
 def render_minimal_natal_chart(
     name: str,
     year: int,
@@ -441,55 +523,53 @@ def render_minimal_natal_chart(
     - NO text overlays (degrees, house numbers, sign names, etc.)
 
     Pure geometric visualization for use with SwiftUI native data display.
+    Like render_natal_chart, each worker caches up to 32 minimal renders.
 
     Returns:
         Tuple of (svg_bytes, media_type)
     """
-    import xml.etree.ElementTree as ET
+    lat, lng = round(lat, COORD_PRECISION), round(lng, COORD_PRECISION)
+    city, nation, cacheable = _birth_place(lat, lng, city)
+    render = _render_minimal_natal_chart if cacheable else _render_minimal_natal_chart.__wrapped__
+    return render(name, year, month, day, hour, minute, lat, lng, tz_str, city, nation)
+
 
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _render_minimal_natal_chart(
+    name: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    lat: float,
+    lng: float,
+    tz_str: str,
+    city: str,
+    nation: str
+):
     # For now, generate the full chart and strip text
     # TODO: Implement proper wheel-only and aspects-only separation
-    svg_content, _ = render_natal_chart(
-        name=name,
-        year=year,
-        month=month,
-        day=day,
-        hour=hour,
-        minute=minute,
-        lat=lat,
-        lng=lng,
-        tz_str=tz_str,
-        output_format="svg",
-        house_system=house_system,
-        city=city
-    )
+    svg_content = _kerykeion_svg(name, year, month, day, hour, minute, lat, lng, tz_str, city, nation)
 
-    # Parse SVG and remove all text elements
-    svg_string = svg_content.decode('utf-8') if isinstance(svg_content, bytes) else svg_content
+    # Only the passes that change geometry or colors; the text-only ones
+    # (fonts, cusp labels, location line) would be stripped right after
+    svg_content = _fix_viewbox_clipping(svg_content)
+    svg_content = _enhance_colors(svg_content)
+    svg_content = _improve_typography(svg_content)         # Planet glyph scale
+    svg_content = _adjust_planet_grid_spacing(svg_content)
 
-    # Register Kerykeion namespace to preserve it during parsing
-    namespaces = {
-        'svg': 'http://www.w3.org/2000/svg',
-        'xlink': 'http://www.w3.org/1999/xlink',
-        'kr': 'http://kerykeion.net'
-    }
+    # Remove all <text> elements (preserving geometry and glyphs)
+    minimal_svg = _TEXT_ELEMENT_RE.sub('', svg_content)
 
-    for prefix, uri in namespaces.items():
-        ET.register_namespace(prefix if prefix != 'svg' else '', uri)
+    return minimal_svg.encode('utf-8'), "image/svg+xml"
 
-    # Parse SVG
-    root = ET.fromstring(svg_string.encode('utf-8'))
 
-    # Remove all <text> elements (preserving geometry and glyphs)
-    for text_elem in root.findall('.//{http://www.w3.org/2000/svg}text'):
-        parent = root.find('.//{http://www.w3.org/2000/svg}text/..', namespaces)
-        if parent is not None:
-            parent.remove(text_elem)
-        else:
-            # Text element is at root level
-            root.remove(text_elem)
-
-    # Convert back to string
-    minimal_svg = ET.tostring(root, encoding='unicode')
+async def render_natal_chart_async(**kwargs):
+    """
+    render_natal_chart in a worker process; returns (image_bytes, media_type).
 
-    return minimal_svg.encode('utf-8'), "image/svg+xml"
+    The render cache lives in each worker (see run_in_process_pool), so
+    repeat requests only hit when they reach the same worker.
+    """
+    return await run_in_process_pool(render_natal_chart, **kwargs)
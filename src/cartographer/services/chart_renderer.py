@@ -29,6 +29,8 @@ import base64
 import xml.etree.ElementTree as ET
 from PIL import Image
 
+from ..features.dignity import calculate_dignity, load_dignity_data
+
 # --- FONT CONFIGURATION ---
 def setup_fonts():
     """Register SF Pro fonts with matplotlib from macOS system paths."""
@@ -68,7 +70,6 @@ def get_symbol_font():
 
 # --- CONFIGURATION ---
 LAYOUT_FILE = "layout_data.json"
-EXALTATIONS_FILE = "exaltations_detriments.json"
 
 # Luminous Chakra Color Palette - Light Mode (Traditional HD colors)
 CENTER_COLORS = {
@@ -400,24 +401,6 @@ def load_json_layout():
         return {}
 
 
-# Cache for exaltations data (loaded once)
-_exaltations_cache = None
-
-def load_exaltations_data():
-    """Loads the exaltations/detriments data for planetary dignities."""
-    global _exaltations_cache
-    if _exaltations_cache is not None:
-        return _exaltations_cache
-    try:
-        data_path = importlib.resources.files("cartographer.data").joinpath(EXALTATIONS_FILE)
-        with data_path.open("r", encoding="utf-8") as f:
-            _exaltations_cache = json.load(f)
-            return _exaltations_cache
-    except Exception as e:
-        print(f"Error loading exaltations file: {e}")
-        return {}
-
-
 def find_planet_at_gate(planets_data, gate):
     """
     Find which planet activates a specific gate.
@@ -474,8 +457,6 @@ def get_planet_dignity(planet_name, gate, line, exaltations_data, harmonic_gate=
 
     Returns: 'exalted', 'detriment', 'juxtaposed', or None
     """
-    from ..features.dignity import calculate_dignity
-
     if not exaltations_data or gate == '–' or line == '–':
         return None
 
@@ -1565,7 +1546,7 @@ def draw_chart(chart_data, layout_data, include_panels=True, include_summary=Tru
     if include_panels:
         _, _, design_planets, personality_planets = normalize_gates_data(chart_data)
         variables = chart_data.get('general', {}).get('variables', {})
-        exaltations = load_exaltations_data()
+        exaltations = load_dignity_data()
         channels = chart_data.get('channels', {}).get('Channels', [])
 
         # Draw Design panel (with Personality as opposite for harmonic fixing)
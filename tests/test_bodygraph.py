@@ -0,0 +1,47 @@
+"""
+Tests for the Human Design bodygraph entry point used by the synthesis router.
+"""
+
+import pytest
+
+from cartographer.features import get_bodygraph
+
+# The default chart of the /humandesign endpoints (Kirikkale, Turkey)
+BIRTH = dict(
+    name="Example Person",
+    year=1968,
+    month=2,
+    day=21,
+    hour=11,
+    minute=0,
+    lat=39.8468,
+    lng=33.5153,
+    tz_str="Europe/Istanbul",
+)
+
+
+@pytest.fixture(scope="module")
+def bodygraph():
+    return get_bodygraph(**BIRTH)
+
+
+def test_bodygraph_matches_humandesign_format(bodygraph):
+    assert bodygraph["name"] == "Example Person"
+    assert set(bodygraph) >= {"type", "general", "gates", "channels"}
+    assert set(bodygraph["gates"]) == {"prs", "des"}
+    assert bodygraph["channels"]["Channels"]
+
+
+def test_bodygraph_features(bodygraph):
+    assert bodygraph["type"] == "Manifesting Generator"
+    assert bodygraph["general"]["energy_type"] == bodygraph["type"]
+    assert bodygraph["general"]["profile"].startswith("2/4")
+    assert bodygraph["general"]["place"] == "39.8468, 33.5153"
+
+
+def test_bodygraph_renders_as_svg(bodygraph):
+    from cartographer.services.chart_renderer import generate_bodygraph_image
+
+    svg = generate_bodygraph_image(bodygraph, fmt="svg")
+    assert svg.lstrip().startswith(b"<?xml")
+    assert b"<svg" in svg
@@ -0,0 +1,51 @@
+"""
+Tests for the synthesis endpoints (combined Astrology + Human Design).
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cartographer.api import app
+from cartographer.schemas.synthesis import MAX_BATCH_ITEMS
+
+PERSON = {
+    "name": "Example Person",
+    "year": 1968,
+    "month": 2,
+    "day": 21,
+    "hour": 11,
+    "minute": 0,
+    "lat": 39.8468,
+    "lng": 33.5153,
+    "tz_str": "Europe/Istanbul",
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_batch_returns_portraits_in_order(client):
+    items = [PERSON, dict(PERSON, name="Second Person", year=1990)]
+    response = client.post("/synthesis/batch", json={"items": items})
+
+    assert response.status_code == 200
+    portraits = response.json()
+    assert [p["name"] for p in portraits] == ["Example Person", "Second Person"]
+    assert portraits[0]["synthesis_notes"]["hd_type"] == "Manifesting Generator"
+
+
+def test_batch_rejects_oversized_requests(client):
+    items = [PERSON] * (MAX_BATCH_ITEMS + 1)
+    response = client.post("/synthesis/batch", json={"items": items})
+
+    assert response.status_code == 422
+
+
+def test_batch_fails_if_any_chart_fails(client):
+    items = [PERSON, dict(PERSON, tz_str="Not/A_Zone")]
+    response = client.post("/synthesis/batch", json={"items": items})
+
+    assert response.status_code == 400